@@ -45,6 +45,12 @@ with app.app_context():
     # Import models to ensure tables are created
     import models
     db.create_all()
+
+login_manager.anonymous_user = models.AnonymousUser
     
 # Import routes after app initialization
 import routes
+
+# Role checks run in a single before_request gate
+import auth_decorators
+auth_decorators.init_app(app)
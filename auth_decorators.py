@@ -1,53 +1,77 @@
 from functools import wraps
-from flask import abort, flash, redirect, url_for
+from typing import Callable
+from flask import current_app, flash, redirect, request, url_for
 from flask_login import current_user
+from werkzeug.exceptions import Forbidden
+from models import ACTIVE, ADMIN, CAN_CALC, CAN_CREATE, ENGINEER
 
-def admin_required(f):
-    """Decorator to require admin role"""
-    @wraps(f)
-    def decorated_function(*args, **kwargs):
-        if not current_user.is_authenticated or not current_user.is_admin():
-            flash('Acesso negado. Apenas administradores podem acessar esta área.', 'danger')
-            return redirect(url_for('dashboard'))
-        return f(*args, **kwargs)
-    return decorated_function
-
-def engineer_required(f):
-    """Decorator to require engineer role (admin or engineer)"""
-    @wraps(f)
-    def decorated_function(*args, **kwargs):
-        if not current_user.is_authenticated or not current_user.is_engineer():
-            flash('Acesso negado. Apenas engenheiros podem acessar esta funcionalidade.', 'danger')
-            return redirect(url_for('dashboard'))
-        return f(*args, **kwargs)
-    return decorated_function
-
-def can_create_projects_required(f):
-    """Decorator to check if user can create projects"""
-    @wraps(f)
-    def decorated_function(*args, **kwargs):
-        if not current_user.is_authenticated or not current_user.can_create_projects():
-            flash('Acesso negado. Você não tem permissão para criar projetos.', 'danger')
-            return redirect(url_for('dashboard'))
-        return f(*args, **kwargs)
-    return decorated_function
-
-def can_perform_calculations_required(f):
-    """Decorator to check if user can perform calculations"""
-    @wraps(f)
-    def decorated_function(*args, **kwargs):
-        if not current_user.is_authenticated or not current_user.can_perform_calculations():
-            flash('Acesso negado. Apenas engenheiros podem realizar cálculos.', 'danger')
-            return redirect(url_for('dashboard'))
-        return f(*args, **kwargs)
-    return decorated_function
-
-def active_user_required(f):
-    """Decorator to check if user account is active"""
-    @wraps(f)
-    def decorated_function(*args, **kwargs):
-        if not current_user.is_authenticated or not current_user.is_active:
-            flash('Conta desativada. Entre em contato com o suporte.', 'danger')
-            return redirect(url_for('index'))
-        return f(*args, **kwargs)
-    return decorated_function
\ No newline at end of file
+# Mensagens de acesso negado
+_MSG_ADMIN = 'Acesso negado. Apenas administradores podem acessar esta área.'
+_MSG_ENGINEER = 'Acesso negado. Apenas engenheiros podem acessar esta funcionalidade.'
+_MSG_CREATE_PROJECTS = 'Acesso negado. Você não tem permissão para criar projetos.'
+_MSG_CALCULATIONS = 'Acesso negado. Apenas engenheiros podem realizar cálculos.'
+_MSG_INACTIVE = 'Conta desativada. Entre em contato com o suporte.'
+
+def _redirect_url(endpoint: str) -> str:
+    """Resolve the denial redirect target once per application"""
+    urls = current_app.extensions.setdefault('auth_redirect_urls', {})
+    url = urls.get(endpoint)
+    if url is None:
+        url = urls[endpoint] = url_for(endpoint)
+    return url
+
+def _wants_json() -> bool:
+    """Check if the client prefers a JSON response over an HTML redirect"""
+    return request.accept_mimetypes.best == 'application/json'
+
+def _auth_required(flag: int, message: str, endpoint: str = 'dashboard',
+                   json_api: bool = False) -> Callable[[Callable], Callable]:
+    """Build a decorator that requires the `flag` bits on the current user
+
+    A denial raises `AccessDenied`, which the 403 handler installed by
+    `init_app` turns into a flash and a redirect to `endpoint`. With
+    `json_api` (or a client that prefers JSON) a denial is a bare 403,
+    skipping the flash message and the session write that comes with it.
+    """
+    def decorator(f: Callable) -> Callable:
+        @wraps(f)
+        def decorated_function(*args, **kwargs):
+            if current_user.role_flags & flag != flag:
+                raise AccessDenied(message, endpoint, json_api)
+            return f(*args, **kwargs)
+        return decorated_function
+    return decorator
+
+class AccessDenied(Forbidden):
+    """403 raised by the role decorators, carrying where to send the user back to"""
+
+    def __init__(self, description: str, endpoint: str = 'dashboard', json_api: bool = False) -> None:
+        super().__init__(description)
+        self.endpoint = endpoint
+        self.json_api = json_api
+
+def _handle_forbidden(e: Forbidden):
+    """Turn a 403 into a flash and redirect, or a bare 403 for JSON clients"""
+    if not isinstance(e, AccessDenied) or e.json_api or _wants_json():
+        return e
+    flash(e.description, 'danger')
+    return redirect(_redirect_url(e.endpoint))
+
+def init_app(app) -> None:
+    """Register the handler that renders role denials on `app`"""
+    app.register_error_handler(403, _handle_forbidden)
+
+admin_required = _auth_required(ADMIN, _MSG_ADMIN)
+admin_required.__doc__ = """Decorator to require admin role"""
+
+engineer_required = _auth_required(ENGINEER, _MSG_ENGINEER)
+engineer_required.__doc__ = """Decorator to require engineer role (admin or engineer)"""
+
+can_create_projects_required = _auth_required(CAN_CREATE, _MSG_CREATE_PROJECTS)
+can_create_projects_required.__doc__ = """Decorator to check if user can create projects"""
+
+can_perform_calculations_required = _auth_required(CAN_CALC, _MSG_CALCULATIONS)
+can_perform_calculations_required.__doc__ = """Decorator to check if user can perform calculations"""
+
+active_user_required = _auth_required(ACTIVE, _MSG_INACTIVE, endpoint='index')
+active_user_required.__doc__ = """Decorator to check if user account is active"""
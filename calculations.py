@@ -1,9 +1,167 @@
 import math
-import json
+from collections import namedtuple
+from functools import lru_cache
+from itertools import count
+from operator import mul
+
+# Math constants hoisted out of the kernels
+_PI_OVER_4 = math.pi / 4
+_PI_SQ = math.pi**2
+_DEG2RAD = math.pi / 180
+
+# Unrounded results returned with raw=True, for parameter sweeps that call
+# the kernels in loops; the rounded dicts remain the API response format
+BeamMoment = namedtuple('BeamMoment', 'moment_max shear_max')
+ConcreteBeam = namedtuple('ConcreteBeam', 'As_required As_min As_final steel_ratio effective_depth fcd fyd')
+PipeFlow = namedtuple('PipeFlow', 'velocity reynolds friction_factor head_loss flow_rate_ms area')
+BearingCapacity = namedtuple('BearingCapacity', 'q_ultimate q_allowable safety_factor Nc Nq Ngamma')
+EulerBuckling = namedtuple('EulerBuckling', 'critical_load_kn critical_stress_mpa effective_length slenderness_ratio')
+LateralTorsionalBuckling = namedtuple('LateralTorsionalBuckling', 'critical_moment_knm torsional_parameter warping_parameter')
+
+# Reference tables looked up or returned with the results. They are shared
+# across calls, so callers must treat them as read-only.
+
+# Typical allowable stresses for different masonry types (kN/m²)
+_MASONRY_ALLOWABLE_STRESSES = {
+    'ceramic_block': 1200,
+    'concrete_block': 1800,
+    'clay_brick': 800
+}
+
+# Typical K factors
+_BUCKLING_K_FACTORS = {
+    'both_pinned': 1.0,
+    'one_fixed_one_pinned': 0.7,
+    'both_fixed': 0.5,
+    'one_fixed_one_free': 2.0
+}
+
+# Typical steel yield strengths
+_TYPICAL_STEEL_STRENGTHS = {
+    'S235': 235,  # MPa
+    'S275': 275,  # MPa
+    'S355': 355   # MPa
+}
+
+# Typical maximum voltage drops
+_MAX_VOLTAGE_DROPS = {
+    'lighting': 3,  # 3% for lighting
+    'motors': 5,    # 5% for motors
+    'general': 4    # 4% for general circuits
+}
+
+# Typical emission factors (kg CO2/kg material)
+_EMISSION_FACTORS = {
+    'cement': 0.87,
+    'steel': 2.29,
+    'aluminum': 11.46,
+    'concrete': 0.11,
+    'wood': -0.9,  # Carbon sequestration
+    'brick': 0.24
+}
+
+# Typical U-values (W/m²·K)
+_THERMAL_LOSS_U_VALUES = {
+    'wall_uninsulated': 2.5,
+    'wall_insulated': 0.3,
+    'roof_uninsulated': 2.0,
+    'roof_insulated': 0.2,
+    'window_single': 5.8,
+    'window_double': 2.8,
+    'window_triple': 1.6
+}
+
+# Safety factors by connection type
+_WOOD_CONNECTION_SAFETY_FACTORS = {
+    'nail': 2.5,
+    'bolt': 3.0,
+    'screw': 2.8
+}
+
+# Typical influence factors
+_SETTLEMENT_INFLUENCE_FACTORS = {
+    'center_flexible': 1.12,
+    'center_rigid': 0.93,
+    'corner_flexible': 0.56,
+    'average_flexible': 0.95
+}
+
+# Typical range check
+_CONCENTRATION_TIME_RANGES = {
+    'urban_min': 5,    # minutes
+    'urban_max': 30,   # minutes  
+    'rural_min': 30,   # minutes
+    'rural_max': 180   # minutes
+}
+
+# Design recommendations
+_DESIGN_STOPPING_DISTANCES = {
+    30: 35,   # km/h: stopping distance (m)
+    40: 50,
+    50: 65,
+    60: 85,
+    70: 105,
+    80: 130,
+    90: 160,
+    100: 190
+}
+
+# Typical illuminance levels (lux)
+_TYPICAL_ILLUMINANCE_LEVELS = {
+    'residence_general': 150,
+    'office_general': 500,
+    'office_tasks': 750,
+    'classroom': 300,
+    'workshop': 300,
+    'parking': 75
+}
+
+# Typical U-values for comparison (W/m²·K)
+_THERMAL_TRANSMISSION_U_VALUES = {
+    'wall_concrete_uninsulated': 2.5,
+    'wall_brick_uninsulated': 2.0,
+    'wall_insulated': 0.4,
+    'roof_concrete_uninsulated': 3.0,
+    'roof_insulated': 0.3,
+    'window_single_glass': 5.8,
+    'window_double_glass': 2.8
+}
+
+# Recommended reverberation times (seconds)
+_RECOMMENDED_REVERBERATION_TIMES = {
+    'speech_small_room': 0.6,
+    'speech_large_room': 1.0,
+    'music_chamber': 1.4,
+    'music_concert_hall': 2.0,
+    'church': 2.5,
+    'classroom': 0.7,
+    'office': 0.5
+}
+
+# Typical gutter dimensions and capacities
+_GUTTER_CAPACITIES = {
+    100: {'diameter_mm': 100, 'capacity_ls': 2.8},
+    125: {'diameter_mm': 125, 'capacity_ls': 4.5},
+    150: {'diameter_mm': 150, 'capacity_ls': 6.8},
+    200: {'diameter_mm': 200, 'capacity_ls': 12.0}
+}
+
+# Batch columns can be any sized sequence. Large scenario sweeps may be held
+# as array.array('f') to halve their memory; iterating one yields Python
+# floats, so every batch still computes and accumulates in double precision.
+def _batch_size(*args):
+    """Length shared by the list arguments of a batch call (1 if none)"""
+    return max((len(arg) for arg in args if not isinstance(arg, (str, int, float))), default=1)
+
+def _as_column(value, n):
+    """Repeat a scalar batch argument `n` times; sequences pass through"""
+    if isinstance(value, (str, int, float)):
+        return [value] * n
+    return value
 
 class StructuralCalculations:
     @staticmethod
-    def calculate_beam_moment(length, load_value, load_type):
+    def calculate_beam_moment(length, load_value, load_type, raw=False):
         """Calculate maximum moment for simply supported beam"""
         if load_type == 'uniform':
             # For uniformly distributed load: M_max = wL²/8
@@ -16,6 +174,9 @@ class StructuralCalculations:
         else:
             raise ValueError("Invalid load type")
         
+        if raw:
+            return BeamMoment(moment_max, shear_max)
+        
         return {
             'moment_max': round(moment_max, 2),
             'shear_max': round(shear_max, 2),
@@ -23,10 +184,32 @@ class StructuralCalculations:
             'load_value': load_value,
             'load_type': load_type
         }
+    
+    @staticmethod
+    def calculate_beam_moment_batch(lengths, load_values, load_type):
+        """Calculate maximum moment and shear for many simply supported beams
+        
+        `load_type` is either one type for every beam or one type per beam.
+        Returns unrounded lists, one entry per beam, for parametric studies.
+        """
+        load_types = _as_column(load_type, len(lengths))
+        beam_moment = StructuralCalculations.calculate_beam_moment
+        
+        moments = []
+        shears = []
+        for length, load_value, beam_load_type in zip(lengths, load_values, load_types):
+            moment_max, shear_max = beam_moment(length, load_value, beam_load_type, raw=True)
+            moments.append(moment_max)
+            shears.append(shear_max)
+        
+        return {
+            'moment_max': moments,
+            'shear_max': shears
+        }
 
 class ConcreteCalculations:
     @staticmethod
-    def calculate_concrete_beam(width, height, moment, fck, fyk):
+    def calculate_concrete_beam(width, height, moment, fck, fyk, raw=False):
         """Basic reinforced concrete beam design"""
         # Convert units
         width_m = width / 100  # cm to m
@@ -53,6 +236,9 @@ class ConcreteCalculations:
         # Steel ratio
         steel_ratio = (As_final / 1000000) / (width_m * d) * 100  # %
         
+        if raw:
+            return ConcreteBeam(As_required, As_min, As_final, steel_ratio, d * 100, fcd, fyd)
+        
         return {
             'As_required': round(As_required, 2),
             'As_min': round(As_min, 2),
@@ -63,9 +249,24 @@ class ConcreteCalculations:
             'fyd': round(fyd, 2)
         }
 
+_INV_2G = 1.0 / (2 * 9.81)  # 1/2g, g = 9.81 m/s²
+
+def _darcy_weisbach_head_loss(friction_factor, length, diameter, velocity):
+    """Darcy-Weisbach head loss hf = f * (L/D) * V²/2g"""
+    return friction_factor * length * velocity * velocity * _INV_2G / diameter
+
+def swamee_jain_friction_factor(relative_roughness, reynolds, _log10=math.log10):
+    """Darcy friction factor from the Swamee-Jain equation
+    
+    Kept as a bare function so iterative network solvers (Hardy-Cross,
+    Newton) can evaluate it per residual without the rounded result dict.
+    """
+    log_term = _log10(relative_roughness/3.7 + 5.74/(reynolds**0.9))
+    return 0.25 / (log_term * log_term)
+
 class HydraulicsCalculations:
     @staticmethod
-    def calculate_pipe_flow(diameter_mm, length_m, flow_rate_ls, roughness_mm):
+    def calculate_pipe_flow(diameter_mm, length_m, flow_rate_ls, roughness_mm, raw=False):
         """Calculate head loss using Darcy-Weisbach equation"""
         # Convert units
         diameter = diameter_mm / 1000  # mm to m
@@ -82,11 +283,13 @@ class HydraulicsCalculations:
         
         # Friction factor using Swamee-Jain equation
         relative_roughness = roughness / diameter
-        friction_factor = 0.25 / (math.log10(relative_roughness/3.7 + 5.74/(reynolds**0.9)))**2
+        friction_factor = swamee_jain_friction_factor(relative_roughness, reynolds)
         
         # Head loss
-        g = 9.81  # gravity
-        head_loss = friction_factor * (length_m / diameter) * (velocity**2) / (2 * g)
+        head_loss = _darcy_weisbach_head_loss(friction_factor, length_m, diameter, velocity)
+        
+        if raw:
+            return PipeFlow(velocity, reynolds, friction_factor, head_loss, flow_rate, area * 10000)
         
         return {
             'velocity': round(velocity, 3),
@@ -96,17 +299,53 @@ class HydraulicsCalculations:
             'flow_rate_ms': round(flow_rate, 6),
             'area': round(area * 10000, 2)  # cm²
         }
+    
+    @staticmethod
+    def calculate_pipe_flow_batch(diameters_mm, lengths_m, flow_rates_ls, roughness_mm):
+        """Calculate Darcy-Weisbach head loss for every pipe of a network
+        
+        `roughness_mm` is either one value for all pipes or one per pipe.
+        Returns unrounded lists, one entry per pipe.
+        """
+        roughness_mm = _as_column(roughness_mm, len(diameters_mm))
+        pipe_flow = HydraulicsCalculations.calculate_pipe_flow
+        
+        velocities = []
+        reynolds_numbers = []
+        friction_factors = []
+        head_losses = []
+        for diameter_mm, length_m, flow_rate_ls, pipe_roughness_mm in zip(
+                diameters_mm, lengths_m, flow_rates_ls, roughness_mm):
+            flow = pipe_flow(diameter_mm, length_m, flow_rate_ls, pipe_roughness_mm, raw=True)
+            velocities.append(flow.velocity)
+            reynolds_numbers.append(flow.reynolds)
+            friction_factors.append(flow.friction_factor)
+            head_losses.append(flow.head_loss)
+        
+        return {
+            'velocity': velocities,
+            'reynolds': reynolds_numbers,
+            'friction_factor': friction_factors,
+            'head_loss': head_losses
+        }
+
+@lru_cache(maxsize=128)
+def _terzaghi_factors(friction_angle):
+    """Terzaghi (Nc, Nq, Ngamma) for a friction angle in degrees"""
+    phi_rad = friction_angle * _DEG2RAD
+    tan_phi = math.tan(phi_rad)
+    tan_half = math.tan(_PI_OVER_4 + phi_rad/2)
+    Nq = math.exp(math.pi * tan_phi) * tan_half * tan_half
+    Nc = (Nq - 1) / tan_phi if friction_angle > 0 else 5.14
+    Ngamma = 2 * (Nq + 1) * tan_phi
+    return Nc, Nq, Ngamma
 
 class FoundationCalculations:
     @staticmethod
-    def calculate_bearing_capacity(width, cohesion, friction_angle, unit_weight, depth):
+    def calculate_bearing_capacity(width, cohesion, friction_angle, unit_weight, depth, raw=False):
         """Calculate ultimate bearing capacity using Terzaghi equation"""
-        phi_rad = math.radians(friction_angle)
-        
         # Terzaghi bearing capacity factors
-        Nq = math.exp(math.pi * math.tan(phi_rad)) * (math.tan(math.pi/4 + phi_rad/2))**2
-        Nc = (Nq - 1) / math.tan(phi_rad) if friction_angle > 0 else 5.14
-        Ngamma = 2 * (Nq + 1) * math.tan(phi_rad)
+        Nc, Nq, Ngamma = _terzaghi_factors(friction_angle)
         
         # Ultimate bearing capacity
         q_ult = cohesion * Nc + unit_weight * depth * Nq + 0.5 * unit_weight * width * Ngamma
@@ -115,6 +354,9 @@ class FoundationCalculations:
         safety_factor = 3
         q_allow = q_ult / safety_factor
         
+        if raw:
+            return BearingCapacity(q_ult, q_allow, safety_factor, Nc, Nq, Ngamma)
+        
         return {
             'q_ultimate': round(q_ult, 2),
             'q_allowable': round(q_allow, 2),
@@ -132,23 +374,27 @@ class TopographyCalculations:
             raise ValueError("Pelo menos 3 pontos são necessários")
         
         n = len(coordinates)
-        area = 0.0
         
-        for i in range(n):
-            j = (i + 1) % n
-            area += coordinates[i][0] * coordinates[j][1]
-            area -= coordinates[j][0] * coordinates[i][1]
+        # Single pass over the edges for both area and perimeter; the
+        # closing edge back to the first vertex is added after the loop
+        x0 = px = float(coordinates[0][0])
+        y0 = py = float(coordinates[0][1])
+        area = 0.0
+        perimeter = 0.0
+        hypot = math.hypot
+        for point in coordinates[1:]:
+            cx = float(point[0])
+            cy = float(point[1])
+            area += px * cy - cx * py
+            perimeter += hypot(cx - px, cy - py)
+            px = cx
+            py = cy
+        
+        area += px * y0 - x0 * py
+        perimeter += hypot(x0 - px, y0 - py)
         
         area = abs(area) / 2.0
         
-        # Calculate perimeter
-        perimeter = 0.0
-        for i in range(n):
-            j = (i + 1) % n
-            dx = coordinates[j][0] - coordinates[i][0]
-            dy = coordinates[j][1] - coordinates[i][1]
-            perimeter += math.sqrt(dx**2 + dy**2)
-        
         return {
             'area': round(area, 2),
             'perimeter': round(perimeter, 2),
@@ -156,14 +402,46 @@ class TopographyCalculations:
             'coordinates': coordinates
         }
 
+def _consolidation_degree(Tv):
+    """Terzaghi average degree of consolidation (%) for time factor Tv"""
+    if Tv <= 0.196:
+        return math.sqrt(4 * Tv / math.pi) * 100
+    return (1 - 8/_PI_SQ * math.exp(-_PI_SQ * Tv / 4)) * 100
+
+# U(Tv) of the exponential branch sampled on 256 evenly spaced points over
+# Tv in [0.196, 2]; the square-root branch below it is cheap to evaluate
+_U_TABLE_TV_MIN = 0.196
+_U_TABLE_TV_MAX = 2.0
+_U_TABLE_STEPS = 255
+_U_TABLE_STEP = (_U_TABLE_TV_MAX - _U_TABLE_TV_MIN) / _U_TABLE_STEPS
+_U_TABLE = [(1 - 8/_PI_SQ * math.exp(-_PI_SQ * (_U_TABLE_TV_MIN + i * _U_TABLE_STEP) / 4)) * 100
+            for i in range(_U_TABLE_STEPS + 1)]
+
+def _consolidation_degree_table(Tv):
+    """Linearly interpolate U(Tv) from the table, exact outside its range"""
+    if Tv <= _U_TABLE_TV_MIN or Tv >= _U_TABLE_TV_MAX:
+        return _consolidation_degree(Tv)
+    position = (Tv - _U_TABLE_TV_MIN) / _U_TABLE_STEP
+    i = int(position)
+    fraction = position - i
+    return _U_TABLE[i] + (_U_TABLE[i + 1] - _U_TABLE[i]) * fraction
+
+@lru_cache(maxsize=128)
+def _rankine_coefficients(friction_angle):
+    """Rankine Ka and Kp from a single sine, via the half-angle identity
+    tan²(45° ∓ φ/2) = (1 ∓ sin φ) / (1 ± sin φ)
+    """
+    sin_phi = math.sin(friction_angle * _DEG2RAD)
+    Ka = (1.0 - sin_phi) / (1.0 + sin_phi)
+    Kp = (1.0 + sin_phi) / (1.0 - sin_phi)
+    return Ka, Kp
+
 class GeotechnicalCalculations:
     @staticmethod
     def calculate_earth_pressure_active(unit_weight, height, friction_angle, cohesion=0):
         """Calculate active earth pressure using Rankine theory"""
-        phi_rad = math.radians(friction_angle)
-        
         # Active earth pressure coefficient
-        Ka = math.tan(math.pi/4 - phi_rad/2)**2
+        Ka, _ = _rankine_coefficients(friction_angle)
         
         # Active earth pressure at depth H
         sigma_v = unit_weight * height  # Vertical stress
@@ -182,10 +460,8 @@ class GeotechnicalCalculations:
     @staticmethod
     def calculate_earth_pressure_passive(unit_weight, height, friction_angle, cohesion=0):
         """Calculate passive earth pressure using Rankine theory"""
-        phi_rad = math.radians(friction_angle)
-        
         # Passive earth pressure coefficient
-        Kp = math.tan(math.pi/4 + phi_rad/2)**2
+        _, Kp = _rankine_coefficients(friction_angle)
         
         # Passive earth pressure at depth H
         sigma_v = unit_weight * height  # Vertical stress
@@ -202,8 +478,17 @@ class GeotechnicalCalculations:
         }
     
     @staticmethod
-    def calculate_settlement_terzaghi(consolidation_coeff, time_days, layer_height):
-        """Calculate settlement using Terzaghi consolidation theory"""
+    def calculate_earth_pressure_coefficients(friction_angle):
+        """Return the Rankine (Ka, Kp) pair for a friction angle in degrees"""
+        return _rankine_coefficients(friction_angle)
+    
+    @staticmethod
+    def calculate_settlement_terzaghi(consolidation_coeff, time_days, layer_height, exact=True):
+        """Calculate settlement using Terzaghi consolidation theory
+        
+        With exact=False the degree of consolidation is interpolated from a
+        precomputed table, which is accurate enough for plotting time series.
+        """
         # Convert time to seconds
         time_sec = time_days * 24 * 3600
         
@@ -214,10 +499,10 @@ class GeotechnicalCalculations:
         Tv = (cv_m2_per_sec * time_sec) / (layer_height**2)
         
         # Degree of consolidation (approximation for Tv < 0.6)
-        if Tv <= 0.196:
-            U = math.sqrt(4 * Tv / math.pi) * 100
+        if exact:
+            U = _consolidation_degree(Tv)
         else:
-            U = (1 - 8/(math.pi**2) * math.exp(-math.pi**2 * Tv / 4)) * 100
+            U = _consolidation_degree_table(Tv)
         
         # Settlement ratio
         settlement_ratio = U / 100
@@ -234,7 +519,7 @@ class PavementCalculations:
     def calculate_flexible_pavement_cbr(traffic_load, cbr_value, k_constant=1.0):
         """Calculate flexible pavement thickness using CBR method"""
         # H = K * (W)^0.25 * CBR^(-0.25)
-        thickness = k_constant * (traffic_load**0.25) * (cbr_value**(-0.25))
+        thickness = k_constant * math.sqrt(math.sqrt(traffic_load)) / math.sqrt(math.sqrt(cbr_value))
         
         # Minimum thickness recommendations
         min_thickness = 15.0  # cm minimum
@@ -268,13 +553,10 @@ class PavementCalculations:
         # Standard axle load = 8.2 tons (18 kips)
         standard_axle = 8.2
         
-        total_esal = 0
-        for i, load in enumerate(axle_loads_tons):
-            if i < len(repetitions):
-                # Load equivalency factor (simplified: (P/8.2)^4)
-                equivalency_factor = (load / standard_axle)**4
-                esal_contribution = repetitions[i] * equivalency_factor
-                total_esal += esal_contribution
+        # Load equivalency factor (simplified: (P/8.2)^4) times repetitions;
+        # zip pairs loads with repetitions and drops any unmatched tail
+        total_esal = sum(reps * (load / standard_axle)**4
+                         for load, reps in zip(axle_loads_tons, repetitions))
         
         return {
             'total_esal': round(total_esal, 0),
@@ -300,35 +582,47 @@ class QuantityCalculations:
         }
     
     @staticmethod
-    def calculate_steel_consumption(bar_data):
+    def calculate_steel_consumption(bar_data, return_details=True):
         """Calculate steel consumption for reinforced concrete
-        bar_data: list of dicts with 'diameter', 'length', 'quantity'
+        bar_data: list of dicts with 'diameter', 'length', 'quantity',
+        a list of (diameter, length, quantity) rows,
+        or a dict of equal-length lists under those same keys
         """
-        total_weight = 0
         steel_density = 7.85  # kg/dm³
-        details = []
         
-        for bar in bar_data:
-            diameter_mm = bar['diameter']
-            length_m = bar['length']
-            quantity = bar['quantity']
-            
-            # Calculate weight per meter: π * d² / 4 * ρ (kg/m)
-            # d in mm -> convert to m for area calculation
-            area_mm2 = math.pi * (diameter_mm/2)**2  # Area in mm²
-            area_m2 = area_mm2 / 1000000  # Convert mm² to m²
-            weight_per_meter = area_m2 * steel_density * 1000  # kg/m (density in kg/dm³)
-            total_weight_bar = weight_per_meter * length_m * quantity
-            
-            details.append({
-                'diameter': diameter_mm,
-                'length': length_m,
-                'quantity': quantity,
-                'weight_per_meter': round(weight_per_meter, 3),
-                'total_weight': round(total_weight_bar, 2)
-            })
-            
-            total_weight += total_weight_bar
+        if isinstance(bar_data, dict):
+            diameters = bar_data['diameter']
+            lengths = bar_data['length']
+            quantities = bar_data['quantity']
+        elif bar_data and not isinstance(bar_data[0], dict):
+            diameters, lengths, quantities = zip(*bar_data)
+        else:
+            diameters = [bar['diameter'] for bar in bar_data]
+            lengths = [bar['length'] for bar in bar_data]
+            quantities = [bar['quantity'] for bar in bar_data]
+        
+        # Weight per meter: π * d² / 4 * ρ (kg/m), d in mm and ρ in kg/dm³,
+        # folded into one factor per mm² of d²
+        kg_per_m_per_mm2 = math.pi / 4 * steel_density / 1000
+        weights_per_meter = [kg_per_m_per_mm2 * d * d for d in diameters]
+        bar_weights = [w * length_m * quantity
+                       for w, length_m, quantity in zip(weights_per_meter, lengths, quantities)]
+        total_weight = sum(bar_weights)
+        
+        if not return_details:
+            return {
+                'total_weight': round(total_weight, 2),
+                'steel_density': steel_density
+            }
+        
+        details = [{
+            'diameter': diameter_mm,
+            'length': length_m,
+            'quantity': quantity,
+            'weight_per_meter': round(weight_per_meter, 3),
+            'total_weight': round(total_weight_bar, 2)
+        } for diameter_mm, length_m, quantity, weight_per_meter, total_weight_bar
+            in zip(diameters, lengths, quantities, weights_per_meter, bar_weights)]
         
         return {
             'total_weight': round(total_weight, 2),
@@ -339,15 +633,12 @@ class QuantityCalculations:
     @staticmethod
     def calculate_mortar_composition(volume_m3, mix_ratio='1:4:1'):
         """Calculate mortar composition (cement:sand:lime)"""
-        # Parse mix ratio
-        parts = [int(x) for x in mix_ratio.split(':')]
-        cement_parts, sand_parts, lime_parts = parts
-        total_parts = sum(parts)
+        cement_share, sand_share, lime_share, total_parts = _parse_mix_ratio(mix_ratio)
         
         # Volume calculations (considering 30% voids for sand)
-        cement_volume = (cement_parts / total_parts) * volume_m3
-        sand_volume = (sand_parts / total_parts) * volume_m3 * 1.3  # Add 30% for voids
-        lime_volume = (lime_parts / total_parts) * volume_m3
+        cement_volume = cement_share * volume_m3
+        sand_volume = sand_share * volume_m3 * 1.3  # Add 30% for voids
+        lime_volume = lime_share * volume_m3
         
         # Material quantities
         cement_kg = cement_volume * 1400  # Cement density ~1400 kg/m³
@@ -363,6 +654,14 @@ class QuantityCalculations:
             'total_parts': total_parts
         }
 
+@lru_cache(maxsize=32)
+def _parse_mix_ratio(mix_ratio):
+    """Parse a 'cement:sand:lime' ratio into each part's share and the total"""
+    cement_parts, sand_parts, lime_parts = (int(x) for x in mix_ratio.split(':'))
+    total_parts = cement_parts + sand_parts + lime_parts
+    return (cement_parts / total_parts, sand_parts / total_parts,
+            lime_parts / total_parts, total_parts)
+
 class MasonryCalculations:
     @staticmethod
     def calculate_brick_consumption(wall_area, brick_length=19, brick_height=9, mortar_joint=1):
@@ -398,15 +697,10 @@ class MasonryCalculations:
         stress = applied_load / wall_area
         
         # Typical allowable stresses for different masonry types (kN/m²)
-        allowable_stresses = {
-            'ceramic_block': 1200,
-            'concrete_block': 1800,
-            'clay_brick': 800
-        }
+        allowable_stresses = _MASONRY_ALLOWABLE_STRESSES
         
-        safety_factors = {}
-        for masonry_type, allowable in allowable_stresses.items():
-            safety_factors[masonry_type] = round(allowable / stress, 2)
+        safety_factors = {masonry_type: round(allowable / stress, 2)
+                          for masonry_type, allowable in allowable_stresses.items()}
         
         return {
             'applied_stress': round(stress, 2),
@@ -433,7 +727,7 @@ class SanitationCalculations:
     def calculate_manning_velocity(hydraulic_radius, slope, manning_n):
         """Calculate velocity in open channel using Manning equation"""
         # V = (1/n) * R^(2/3) * S^(1/2)
-        velocity = (1/manning_n) * (hydraulic_radius**(2/3)) * (slope**(1/2))
+        velocity = math.cbrt(hydraulic_radius * hydraulic_radius) * math.sqrt(slope) / manning_n
         
         return {
             'velocity': round(velocity, 3),
@@ -445,10 +739,8 @@ class SanitationCalculations:
     @staticmethod
     def calculate_darcy_weisbach_loss(friction_factor, length, diameter, velocity):
         """Calculate head loss using Darcy-Weisbach equation"""
-        g = 9.81  # gravity acceleration
-        
         # hf = f * (L/D) * (V²/2g)
-        head_loss = friction_factor * (length/diameter) * (velocity**2) / (2*g)
+        head_loss = _darcy_weisbach_head_loss(friction_factor, length, diameter, velocity)
         
         return {
             'head_loss': round(head_loss, 3),
@@ -478,15 +770,10 @@ class AdvancedCalculations:
     def calculate_euler_buckling(elastic_modulus, moment_inertia, k_factor, length):
         """Calculate critical buckling load using Euler formula"""
         # P_cr = π²EI/(KL)²
-        critical_load = (math.pi**2 * elastic_modulus * moment_inertia) / (k_factor * length)**2
+        critical_load = (_PI_SQ * elastic_modulus * moment_inertia) / (k_factor * length)**2
         
         # Typical K factors
-        k_factors = {
-            'both_pinned': 1.0,
-            'one_fixed_one_pinned': 0.7,
-            'both_fixed': 0.5,
-            'one_fixed_one_free': 2.0
-        }
+        k_factors = _BUCKLING_K_FACTORS
         
         return {
             'critical_load': round(critical_load, 2),
@@ -527,12 +814,12 @@ class HydrologyCalculations:
         elif method == 'nrcs':
             # tc = K * L^0.8 / S^0.5
             k = 0.057
-            tc = k * (length_km**0.8) / (slope**0.5)
+            tc = k * (length_km**0.8) / math.sqrt(slope)
             
         else:
             # Default to NRCS method
             k = 0.057
-            tc = k * (length_km**0.8) / (slope**0.5)
+            tc = k * (length_km**0.8) / math.sqrt(slope)
         
         return {
             'time_concentration': round(tc, 2),
@@ -564,15 +851,11 @@ class SteelStructuresCalculations:
         stress = (force_kn * 1000) / (cross_area_cm2 / 100)  # Convert to N/mm²
         
         # Check against typical steel strengths
-        typical_strengths = {
-            'S235': 235,  # MPa
-            'S275': 275,  # MPa
-            'S355': 355   # MPa
-        }
+        typical_strengths = _TYPICAL_STEEL_STRENGTHS
         
-        safety_factors = {}
-        for steel_type, strength in typical_strengths.items():
-            safety_factors[steel_type] = round(strength / abs(stress), 2)
+        abs_stress = abs(stress)
+        safety_factors = {steel_type: round(strength / abs_stress, 2)
+                          for steel_type, strength in typical_strengths.items()}
         
         return {
             'stress': round(stress, 2),
@@ -589,10 +872,11 @@ class SteelStructuresCalculations:
         load_n = load_kn * 1000
         moment_inertia_mm4 = moment_inertia_cm4 * 10000  # cm4 to mm4
         
-        deflection = (load_n * (length_m * 1000)**3) / (48 * elastic_modulus * moment_inertia_mm4)
+        length_mm = length_m * 1000.0
+        deflection = (load_n * length_mm * length_mm * length_mm) / (48 * elastic_modulus * moment_inertia_mm4)
         
         # Check against typical limits
-        allowable_deflection = (length_m * 1000) / 250  # L/250
+        allowable_deflection = length_mm / 250  # L/250
         safety_ratio = allowable_deflection / abs(deflection)
         
         return {
@@ -604,22 +888,28 @@ class SteelStructuresCalculations:
         }
 
 
+def _precast_element(span_m, distributed_load, element_height_cm, concrete_fck):
+    """(moment, deflection, inertia, modulus, width) of a simply supported precast element"""
+    # Maximum moment for simply supported beam
+    max_moment = (distributed_load * span_m**2) / 8
+    
+    # Estimate moment of inertia (rectangular section)
+    width_cm = element_height_cm * 0.4  # Typical ratio
+    moment_inertia = (width_cm * element_height_cm**3) / 12
+    
+    # Elastic modulus from concrete strength
+    elastic_modulus = 5600 * math.sqrt(concrete_fck)  # MPa
+    
+    # Maximum deflection
+    max_deflection = (5 * distributed_load * (span_m * 1000)**4) / (384 * elastic_modulus * moment_inertia * 10**8)
+    return max_moment, max_deflection, moment_inertia, elastic_modulus, width_cm
+
 class IndustrialConstructionCalculations:
     @staticmethod
     def calculate_precast_element(span_m, distributed_load, element_height_cm, concrete_fck):
         """Calculate moment and deflection for precast elements"""
-        # Maximum moment for simply supported beam
-        max_moment = (distributed_load * span_m**2) / 8
-        
-        # Estimate moment of inertia (rectangular section)
-        width_cm = element_height_cm * 0.4  # Typical ratio
-        moment_inertia = (width_cm * element_height_cm**3) / 12
-        
-        # Elastic modulus from concrete strength
-        elastic_modulus = 5600 * math.sqrt(concrete_fck)  # MPa
-        
-        # Maximum deflection
-        max_deflection = (5 * distributed_load * (span_m * 1000)**4) / (384 * elastic_modulus * moment_inertia * 10**8)
+        max_moment, max_deflection, moment_inertia, elastic_modulus, width_cm = _precast_element(
+            span_m, distributed_load, element_height_cm, concrete_fck)
         
         return {
             'max_moment_knm': round(max_moment, 2),
@@ -629,27 +919,59 @@ class IndustrialConstructionCalculations:
             'estimated_width_cm': round(width_cm, 1)
         }
     
+    @staticmethod
+    def calculate_precast_element_batch(spans_m, distributed_loads, element_heights_cm, concrete_fck):
+        """Calculate moment and deflection for many precast elements
+        
+        Any argument may be a single value shared by every element.
+        Returns unrounded lists, one entry per element.
+        """
+        n = _batch_size(spans_m, distributed_loads, element_heights_cm, concrete_fck)
+        
+        moments = []
+        deflections = []
+        inertias = []
+        moduli = []
+        for span_m, load, height_cm, fck in zip(_as_column(spans_m, n), _as_column(distributed_loads, n),
+                                                _as_column(element_heights_cm, n), _as_column(concrete_fck, n)):
+            moment, deflection, moment_inertia, elastic_modulus, _ = _precast_element(span_m, load, height_cm, fck)
+            moments.append(moment)
+            deflections.append(deflection)
+            inertias.append(moment_inertia)
+            moduli.append(elastic_modulus)
+        
+        return {
+            'max_moment_knm': moments,
+            'max_deflection_mm': deflections,
+            'moment_inertia_cm4': inertias,
+            'elastic_modulus_mpa': moduli
+        }
+    
     @staticmethod
     def calculate_ribbed_slab_inertia(rib_width_cm, rib_height_cm, flange_thickness_cm, rib_spacing_cm):
         """Calculate effective moment of inertia for ribbed slab"""
         # Simplified calculation for T-section
-        effective_width = min(rib_spacing_cm, rib_width_cm + 8 * flange_thickness_cm)
-        
-        # Calculate composite section properties
-        total_height = rib_height_cm + flange_thickness_cm
-        
-        # Area and centroid calculations for T-section
-        flange_area = effective_width * flange_thickness_cm
-        rib_area = rib_width_cm * rib_height_cm
+        tf = flange_thickness_cm
+        hr = rib_height_cm
+        br = rib_width_cm
+        effective_width = min(rib_spacing_cm, br + 8 * tf)
+        
+        # Composite section properties
+        total_height = hr + tf
+        flange_area = effective_width * tf
+        rib_area = br * hr
         total_area = flange_area + rib_area
         
-        # Centroid from bottom
-        y_centroid = (rib_area * (rib_height_cm/2) + flange_area * (rib_height_cm + flange_thickness_cm/2)) / total_area
+        # Centroid from bottom and each part's offset from it
+        flange_mid = hr + tf * 0.5
+        rib_mid = hr * 0.5
+        y_centroid = (rib_area * rib_mid + flange_area * flange_mid) / total_area
+        d_flange = flange_mid - y_centroid
+        d_rib = rib_mid - y_centroid
         
         # Moment of inertia about centroidal axis
-        I_flange = (effective_width * flange_thickness_cm**3) / 12 + flange_area * (rib_height_cm + flange_thickness_cm/2 - y_centroid)**2
-        I_rib = (rib_width_cm * rib_height_cm**3) / 12 + rib_area * (rib_height_cm/2 - y_centroid)**2
-        I_effective = I_flange + I_rib
+        I_effective = (flange_area * tf * tf / 12 + flange_area * d_flange * d_flange
+                       + rib_area * hr * hr / 12 + rib_area * d_rib * d_rib)
         
         return {
             'effective_inertia_cm4': round(I_effective, 2),
@@ -668,11 +990,7 @@ class BuildingInstallationsCalculations:
         voltage_drop = current_a * resistance_ohm_km * length_km
         
         # Typical maximum voltage drops
-        max_drops = {
-            'lighting': 3,  # 3% for lighting
-            'motors': 5,    # 5% for motors
-            'general': 4    # 4% for general circuits
-        }
+        max_drops = _MAX_VOLTAGE_DROPS
         
         return {
             'voltage_drop_v': round(voltage_drop, 2),
@@ -702,6 +1020,23 @@ class BuildingInstallationsCalculations:
         }
 
 
+def _s_curve_normal(t):
+    """Standard S-curve: slower start and end"""
+    if t <= 0.5:
+        return 2 * t * t
+    return 1 - 2 * (1 - t) * (1 - t)
+
+def _s_curve_linear(t):
+    return t
+
+# Cumulative fraction as a function of the time fraction, per curve type;
+# anything else is linear
+_S_CURVE_SHAPES = {
+    'normal': _s_curve_normal,
+    'fast_start': lambda t: t**0.7,  # Fast start, slow finish
+    'slow_start': lambda t: t * math.sqrt(t),  # Slow start, fast finish (t^1.5)
+}
+
 class ConstructionControlCalculations:
     @staticmethod
     def calculate_productivity(quantity_executed, time_spent_hours):
@@ -729,24 +1064,7 @@ class ConstructionControlCalculations:
         """Calculate S-curve value for construction project"""
         # Different S-curve models
         t = current_time_percent / 100  # Convert to decimal
-        
-        if curve_type == 'normal':
-            # Standard S-curve: slower start and end
-            if t <= 0.5:
-                cumulative_percent = 2 * t**2
-            else:
-                cumulative_percent = 1 - 2 * (1 - t)**2
-                
-        elif curve_type == 'fast_start':
-            # Fast start, slow finish
-            cumulative_percent = t**0.7
-            
-        elif curve_type == 'slow_start':
-            # Slow start, fast finish
-            cumulative_percent = t**1.5
-            
-        else:  # linear
-            cumulative_percent = t
+        cumulative_percent = _S_CURVE_SHAPES.get(curve_type, _s_curve_linear)(t)
         
         cumulative_cost = total_budget * cumulative_percent
         
@@ -757,6 +1075,19 @@ class ConstructionControlCalculations:
             'total_budget': total_budget,
             'curve_type': curve_type
         }
+    
+    @staticmethod
+    def calculate_s_curve_batch(total_budget, time_percents, curve_type='normal'):
+        """Calculate the S-curve at many time points, e.g. to plot it whole
+        
+        Returns unrounded cumulative costs and fractions, one per time point.
+        """
+        shape = _S_CURVE_SHAPES.get(curve_type, _s_curve_linear)
+        fractions = [shape(time_percent / 100) for time_percent in time_percents]
+        return {
+            'cumulative_cost': [total_budget * fraction for fraction in fractions],
+            'cumulative_fraction': fractions
+        }
 
 
 class SustainabilityCalculations:
@@ -767,14 +1098,7 @@ class SustainabilityCalculations:
         co2_emissions = material_mass_kg * emission_factor_kg_co2_kg
         
         # Typical emission factors (kg CO2/kg material)
-        emission_factors = {
-            'cement': 0.87,
-            'steel': 2.29,
-            'aluminum': 11.46,
-            'concrete': 0.11,
-            'wood': -0.9,  # Carbon sequestration
-            'brick': 0.24
-        }
+        emission_factors = _EMISSION_FACTORS
         
         return {
             'co2_emissions_kg': round(co2_emissions, 2),
@@ -795,15 +1119,7 @@ class SustainabilityCalculations:
         daily_energy_kwh = (heat_loss_w * 24) / 1000
         
         # Typical U-values (W/m²·K)
-        typical_u_values = {
-            'wall_uninsulated': 2.5,
-            'wall_insulated': 0.3,
-            'roof_uninsulated': 2.0,
-            'roof_insulated': 0.2,
-            'window_single': 5.8,
-            'window_double': 2.8,
-            'window_triple': 1.6
-        }
+        typical_u_values = _THERMAL_LOSS_U_VALUES
         
         return {
             'heat_loss_w': round(heat_loss_w, 2),
@@ -816,17 +1132,23 @@ class SustainabilityCalculations:
         }
 
 
+def _load_combination(dead_load, live_load, wind_load, snow_load, alpha_d, alpha_l, alpha_w, alpha_s):
+    """(U, dead %, live %, wind %, snow %) of U = αD·D + αL·L + αW·W + αS·S"""
+    ultimate_load = alpha_d * dead_load + alpha_l * live_load + alpha_w * wind_load + alpha_s * snow_load
+    
+    # Calculate individual contributions
+    dead_contribution = (alpha_d * dead_load / ultimate_load) * 100 if ultimate_load > 0 else 0
+    live_contribution = (alpha_l * live_load / ultimate_load) * 100 if ultimate_load > 0 else 0
+    wind_contribution = (alpha_w * wind_load / ultimate_load) * 100 if ultimate_load > 0 else 0
+    snow_contribution = (alpha_s * snow_load / ultimate_load) * 100 if ultimate_load > 0 else 0
+    return ultimate_load, dead_contribution, live_contribution, wind_contribution, snow_contribution
+
 class AdvancedStructuralCalculations:
     @staticmethod
     def calculate_load_combination(dead_load, live_load, wind_load, snow_load, alpha_d=1.2, alpha_l=1.6, alpha_w=1.6, alpha_s=1.2):
         """Calculate load combination: U = αD·D + αL·L + αW·W + αS·S"""
-        ultimate_load = alpha_d * dead_load + alpha_l * live_load + alpha_w * wind_load + alpha_s * snow_load
-        
-        # Calculate individual contributions
-        dead_contribution = (alpha_d * dead_load / ultimate_load) * 100 if ultimate_load > 0 else 0
-        live_contribution = (alpha_l * live_load / ultimate_load) * 100 if ultimate_load > 0 else 0
-        wind_contribution = (alpha_w * wind_load / ultimate_load) * 100 if ultimate_load > 0 else 0
-        snow_contribution = (alpha_s * snow_load / ultimate_load) * 100 if ultimate_load > 0 else 0
+        ultimate_load, dead_contribution, live_contribution, wind_contribution, snow_contribution = \
+            _load_combination(dead_load, live_load, wind_load, snow_load, alpha_d, alpha_l, alpha_w, alpha_s)
         
         return {
             'ultimate_load': round(ultimate_load, 2),
@@ -837,6 +1159,34 @@ class AdvancedStructuralCalculations:
             'formula': 'U = αD·D + αL·L + αW·W + αS·S'
         }
 
+    @staticmethod
+    def calculate_load_combination_batch(dead_loads, live_loads, wind_loads, snow_loads, alphas=(1.2, 1.6, 1.6, 1.2)):
+        """Evaluate one load combination for many load cases
+        
+        `alphas` are the (αD, αL, αW, αS) factors. Returns the ultimate loads
+        and each load's share (%) as separate unrounded lists.
+        """
+        ultimate_loads = []
+        dead_pct = []
+        live_pct = []
+        wind_pct = []
+        snow_pct = []
+        for d, l, w, s in zip(dead_loads, live_loads, wind_loads, snow_loads):
+            ultimate, dead, live, wind, snow = _load_combination(d, l, w, s, *alphas)
+            ultimate_loads.append(ultimate)
+            dead_pct.append(dead)
+            live_pct.append(live)
+            wind_pct.append(wind)
+            snow_pct.append(snow)
+        
+        return {
+            'ultimate_load': ultimate_loads,
+            'dead_contribution_pct': dead_pct,
+            'live_contribution_pct': live_pct,
+            'wind_contribution_pct': wind_pct,
+            'snow_contribution_pct': snow_pct
+        }
+
     @staticmethod
     def calculate_concrete_shear(asv, fy, d, s):
         """Calculate concrete shear resistance: Vs = (Asv·fy·d)/s"""
@@ -874,34 +1224,43 @@ class AdvancedStructuralCalculations:
         }
 
     @staticmethod
-    def calculate_euler_buckling(e_modulus, moment_inertia, k_factor, length):
+    def calculate_euler_buckling(e_modulus, moment_inertia, k_factor, length, raw=False):
         """Calculate Euler critical load: Pcr = π²EI/(KL)²"""
         kl_effective = k_factor * length
-        pcr = (math.pi**2 * e_modulus * moment_inertia) / (kl_effective**2)
+        pcr = (_PI_SQ * e_modulus * moment_inertia) / (kl_effective * kl_effective)
         
         # Critical stress (assuming area from typical steel section)
         area_estimated = moment_inertia / (length**2 / 12)  # Rough estimation
         sigma_cr = pcr / area_estimated if area_estimated > 0 else 0
+        slenderness = kl_effective / math.sqrt(moment_inertia / area_estimated) if area_estimated > 0 else 0
+        
+        if raw:
+            return EulerBuckling(pcr / 1000, sigma_cr / 1000000, kl_effective, slenderness)
         
         return {
             'critical_load_kn': round(pcr / 1000, 2),
             'critical_stress_mpa': round(sigma_cr / 1000000, 2),
             'effective_length': round(kl_effective, 2),
-            'slenderness_ratio': round(kl_effective / math.sqrt(moment_inertia / area_estimated), 1) if area_estimated > 0 else 0,
+            'slenderness_ratio': round(slenderness, 1) if area_estimated > 0 else 0,
             'formula': 'Pcr = π²EI/(KL)²'
         }
 
     @staticmethod
-    def calculate_lateral_torsional_buckling(c1, e_modulus, iz, lb, g_modulus, j_constant, iw):
+    def calculate_lateral_torsional_buckling(c1, e_modulus, iz, lb, g_modulus, j_constant, iw, raw=False):
         """Calculate critical moment for lateral-torsional buckling (simplified)"""
+        lb_sq = lb * lb
+        
         # First term under square root
         term1 = (g_modulus * j_constant) / (e_modulus * iz)
         
         # Second term under square root  
-        term2 = (math.pi**2 * iw) / (lb**2 * iz)
+        term2 = (_PI_SQ * iw) / (lb_sq * iz)
         
         # Critical moment calculation
-        mcr = c1 * ((math.pi**2 * e_modulus * iz) / lb**2) * math.sqrt(term1 + term2)
+        mcr = c1 * ((_PI_SQ * e_modulus * iz) / lb_sq) * math.sqrt(term1 + term2)
+        
+        if raw:
+            return LateralTorsionalBuckling(mcr / 1000000, math.sqrt(term1), math.sqrt(term2))
         
         return {
             'critical_moment_knm': round(mcr / 1000000, 2),
@@ -921,49 +1280,81 @@ class AdvancedStructuralCalculations:
             'withdrawal': withdrawal_strength
         }
         
-        # Find governing mode
-        governing_capacity = min(capacities.values())
-        governing_mode = min(capacities.keys(), key=lambda k: capacities[k])
+        # Find governing mode and its capacity in a single pass
+        governing_mode = min(capacities, key=capacities.__getitem__)
+        governing_capacity = capacities[governing_mode]
         
-        # Safety factors by connection type
-        safety_factors = {
-            'nail': 2.5,
-            'bolt': 3.0,
-            'screw': 2.8
-        }
+        # Safety factor by connection type
+        safety_factor = _WOOD_CONNECTION_SAFETY_FACTORS.get(connection_type, 2.5)
         
-        allowable_capacity = governing_capacity / safety_factors.get(connection_type, 2.5)
+        allowable_capacity = governing_capacity / safety_factor
         
         return {
             'nominal_capacity_kn': round(governing_capacity, 2),
             'allowable_capacity_kn': round(allowable_capacity, 2),
             'governing_mode': governing_mode,
-            'safety_factor': safety_factors.get(connection_type, 2.5),
+            'safety_factor': safety_factor,
             'capacity_breakdown': {k: round(v, 2) for k, v in capacities.items()},
             'formula': 'Rn = min{Remb, Rflex, Rarranc}'
         }
 
 
+@lru_cache(maxsize=4096)
+def _slope_trig(slope_angle, friction_angle):
+    """cos²θ, sin θ·cos θ and tan φ of an infinite slope, memoized because
+    sweeps repeat the same few layer and slope angles
+    """
+    theta_rad = slope_angle * _DEG2RAD
+    cos_theta = math.cos(theta_rad)
+    return cos_theta * cos_theta, math.sin(theta_rad) * cos_theta, math.tan(friction_angle * _DEG2RAD)
+
+def _infinite_slope(cohesion, unit_weight, depth, slope_angle, friction_angle, pore_pressure):
+    """(FS, τ, τf, σn) on the failure plane of an infinite slope"""
+    cos2_theta, sin_cos_theta, tan_phi = _slope_trig(slope_angle, friction_angle)
+    
+    # Vertical stress
+    sigma_v = unit_weight * depth
+    
+    # Normal stress on failure plane
+    sigma_n = sigma_v * cos2_theta
+    
+    # Shear stress on failure plane
+    tau = sigma_v * sin_cos_theta
+    
+    # Shear strength
+    tau_f = cohesion + (sigma_n - pore_pressure) * tan_phi
+    
+    # Factor of safety
+    fs = tau_f / tau if tau > 0 else float('inf')
+    return fs, tau, tau_f, sigma_n
+
+def _eccentric_footing_stress(normal_force, base_width, base_length, eccentricity):
+    """(σmax, σmin, N/BL, kern limit, within kern, contact length) of a footing"""
+    area = base_width * base_length
+    average_stress = normal_force / area
+    
+    # Check if eccentricity is within kern limit
+    kern_limit = base_width / 6
+    within_kern = abs(eccentricity) <= kern_limit
+    
+    if within_kern:
+        bending = 6 * eccentricity / base_width
+        stress_max = average_stress * (1 + bending)
+        stress_min = average_stress * (1 - bending)
+        contact_length = base_length
+    else:
+        # Partial contact case
+        contact_length = 3 * (base_width/2 - abs(eccentricity))
+        stress_max = (2 * normal_force) / (base_width * contact_length)
+        stress_min = 0
+    return stress_max, stress_min, average_stress, kern_limit, within_kern, contact_length
+
 class AdvancedGeotechnicalCalculations:
     @staticmethod
     def calculate_eccentric_footing_stress(normal_force, base_width, base_length, eccentricity):
         """Calculate stress under footing with eccentricity: σ = N/BL(1 ± 6e/B)"""
-        area = base_width * base_length
-        average_stress = normal_force / area
-        
-        # Check if eccentricity is within kern limit
-        kern_limit = base_width / 6
-        within_kern = abs(eccentricity) <= kern_limit
-        
-        if within_kern:
-            stress_max = average_stress * (1 + 6 * eccentricity / base_width)
-            stress_min = average_stress * (1 - 6 * eccentricity / base_width)
-            contact_length = base_length
-        else:
-            # Partial contact case
-            contact_length = 3 * (base_width/2 - abs(eccentricity))
-            stress_max = (2 * normal_force) / (base_width * contact_length)
-            stress_min = 0
+        stress_max, stress_min, average_stress, kern_limit, within_kern, contact_length = \
+            _eccentric_footing_stress(normal_force, base_width, base_length, eccentricity)
         
         return {
             'stress_max_kpa': round(stress_max, 2),
@@ -976,25 +1367,36 @@ class AdvancedGeotechnicalCalculations:
         }
 
     @staticmethod
-    def calculate_infinite_slope_stability(cohesion, unit_weight, depth, slope_angle, friction_angle, pore_pressure=0):
-        """Calculate factor of safety for infinite slope: FS = [c' + (γz cos²θ - u)tan φ'] / (γz sin θ cos θ)"""
-        theta_rad = math.radians(slope_angle)
-        phi_rad = math.radians(friction_angle)
-        
-        # Vertical stress
-        sigma_v = unit_weight * depth
-        
-        # Normal stress on failure plane
-        sigma_n = sigma_v * (math.cos(theta_rad))**2
+    def calculate_eccentric_footing_stress_batch(normal_forces, base_width, base_length, eccentricities):
+        """Edge stresses under many eccentrically loaded footings
         
-        # Shear stress on failure plane
-        tau = sigma_v * math.sin(theta_rad) * math.cos(theta_rad)
-        
-        # Shear strength
-        tau_f = cohesion + (sigma_n - pore_pressure) * math.tan(phi_rad)
+        Any argument may be a single value shared by every footing.
+        Returns unrounded lists; contact length is the full base length
+        within the kern and the reduced length outside it.
+        """
+        n = _batch_size(normal_forces, base_width, base_length, eccentricities)
+        
+        stresses_max = []
+        stresses_min = []
+        contact_lengths = []
+        for force, width, length, e in zip(_as_column(normal_forces, n), _as_column(base_width, n),
+                                           _as_column(base_length, n), _as_column(eccentricities, n)):
+            stress_max, stress_min, _, _, _, contact_length = _eccentric_footing_stress(force, width, length, e)
+            stresses_max.append(stress_max)
+            stresses_min.append(stress_min)
+            contact_lengths.append(contact_length)
         
-        # Factor of safety
-        fs = tau_f / tau if tau > 0 else float('inf')
+        return {
+            'stress_max_kpa': stresses_max,
+            'stress_min_kpa': stresses_min,
+            'contact_length_m': contact_lengths
+        }
+
+    @staticmethod
+    def calculate_infinite_slope_stability(cohesion, unit_weight, depth, slope_angle, friction_angle, pore_pressure=0):
+        """Calculate factor of safety for infinite slope: FS = [c' + (γz cos²θ - u)tan φ'] / (γz sin θ cos θ)"""
+        fs, tau, tau_f, sigma_n = _infinite_slope(cohesion, unit_weight, depth, slope_angle,
+                                                  friction_angle, pore_pressure)
         
         return {
             'factor_of_safety': round(fs, 3),
@@ -1006,18 +1408,40 @@ class AdvancedGeotechnicalCalculations:
             'formula': "FS = [c' + (γz cos²θ - u)tan φ'] / (γz sin θ cos θ)"
         }
 
+    @staticmethod
+    def calculate_infinite_slope_stability_batch(cohesion, unit_weight, depth, slope_angle, friction_angle, pore_pressure=0):
+        """Factor of safety of an infinite slope for many cases at once
+        
+        Any argument may be a list (depth profiles, parameter sweeps, Monte
+        Carlo pore pressures) or a single value shared by every case; all
+        lists must have the same length. Returns unrounded lists.
+        """
+        n = _batch_size(cohesion, unit_weight, depth, slope_angle, friction_angle, pore_pressure)
+        
+        factors_of_safety = []
+        shear_stresses = []
+        shear_strengths = []
+        for c, gamma, z, theta, phi, u in zip(_as_column(cohesion, n), _as_column(unit_weight, n),
+                                              _as_column(depth, n), _as_column(slope_angle, n),
+                                              _as_column(friction_angle, n), _as_column(pore_pressure, n)):
+            fs, tau, tau_f, _ = _infinite_slope(c, gamma, z, theta, phi, u)
+            factors_of_safety.append(fs)
+            shear_stresses.append(tau)
+            shear_strengths.append(tau_f)
+        
+        return {
+            'factor_of_safety': factors_of_safety,
+            'shear_stress_kpa': shear_stresses,
+            'shear_strength_kpa': shear_strengths
+        }
+
     @staticmethod
     def calculate_elastic_settlement(q_load, width, elastic_modulus, poisson_ratio, influence_factor=1.0):
         """Calculate elastic settlement: s = qB(1-ν²)Is/E"""
         settlement = (q_load * width * (1 - poisson_ratio**2) * influence_factor) / elastic_modulus
         
         # Typical influence factors
-        typical_factors = {
-            'center_flexible': 1.12,
-            'center_rigid': 0.93,
-            'corner_flexible': 0.56,
-            'average_flexible': 0.95
-        }
+        typical_factors = _SETTLEMENT_INFLUENCE_FACTORS
         
         return {
             'settlement_mm': round(settlement * 1000, 2),
@@ -1036,7 +1460,7 @@ class AdvancedGeotechnicalCalculations:
         point_resistance = qp * ap
         
         # Shaft resistance (sum of all layers)
-        shaft_resistance = sum(fs * a_s for fs, a_s in zip(fs_values, as_values))
+        shaft_resistance = sum(map(mul, fs_values, as_values))
         
         # Ultimate capacity
         qu = point_resistance + shaft_resistance
@@ -1060,22 +1484,53 @@ class AdvancedGeotechnicalCalculations:
         }
 
 
+def _scs_runoff(precipitation, curve_number):
+    """(Q, S, Ia) in mm of the SCS curve number method"""
+    # Storage parameter (mm)
+    s_storage = (25400 / curve_number) - 254
+    
+    # Initial abstraction (mm)
+    ia = 0.2 * s_storage
+    
+    # Direct runoff (only if P > Ia)
+    if precipitation > ia:
+        runoff = ((precipitation - ia)**2) / (precipitation - ia + s_storage)
+    else:
+        runoff = 0
+    return runoff, s_storage, ia
+
+def _kirpich_time(length_km, slope_percent):
+    """Kirpich time of concentration in minutes"""
+    if slope_percent <= 0:
+        raise ValueError("Slope must be greater than zero")
+    return 0.0195 * (length_km * 1000)**0.77 * (slope_percent/100)**(-0.385)
+
+def _water_hammer_pressure(density, wave_velocity, velocity_change):
+    """Joukowsky surge Δp = ρaΔV in Pa"""
+    return density * wave_velocity * abs(velocity_change)
+
+def _pump_similarity(n1, q1, h1, p1, n2):
+    """(Q2, H2, P2, N2/N1) of a pump moved from speed n1 to n2"""
+    # Speed ratio and its powers, taken once for the three laws
+    r = n2 / n1
+    r2 = r * r
+    
+    # Flow rate ratio
+    q2 = q1 * r
+    
+    # Head ratio
+    h2 = h1 * r2
+    
+    # Power ratio
+    p2 = p1 * r2 * r
+    return q2, h2, p2, r
+
 class AdvancedHydrologyCalculations:
     @staticmethod
     def calculate_scs_runoff(precipitation, curve_number):
         """Calculate SCS runoff: Q = (P-Ia)²/(P-Ia+S) where S = 25400/CN - 254"""
-        # Storage parameter (mm)
-        s_storage = (25400 / curve_number) - 254
-        
-        # Initial abstraction (mm)
-        ia = 0.2 * s_storage
+        runoff, s_storage, ia = _scs_runoff(precipitation, curve_number)
         
-        # Direct runoff (only if P > Ia)
-        if precipitation > ia:
-            runoff = ((precipitation - ia)**2) / (precipitation - ia + s_storage)
-        else:
-            runoff = 0
-            
         # Runoff coefficient
         runoff_coefficient = runoff / precipitation if precipitation > 0 else 0
         
@@ -1089,22 +1544,25 @@ class AdvancedHydrologyCalculations:
             'formula': 'Q = (P-Ia)²/(P-Ia+S); S = 25400/CN - 254; Ia = 0.2S'
         }
 
+    @staticmethod
+    def calculate_scs_runoff_batch(precipitations, curve_numbers):
+        """SCS direct runoff (mm) over a grid of storms and subbasins
+        
+        Either argument may be a single value shared by every entry.
+        Returns an unrounded runoff list.
+        """
+        n = _batch_size(precipitations, curve_numbers)
+        return [_scs_runoff(precipitation, curve_number)[0]
+                for precipitation, curve_number in zip(_as_column(precipitations, n), _as_column(curve_numbers, n))]
+
     @staticmethod
     def calculate_kirpich_time(length_km, slope_percent):
         """Calculate time of concentration (Kirpich): tc(min) = 0.0195 L^0.77 S^-0.385"""
-        if slope_percent <= 0:
-            raise ValueError("Slope must be greater than zero")
-            
-        tc_minutes = 0.0195 * (length_km * 1000)**0.77 * (slope_percent/100)**(-0.385)
+        tc_minutes = _kirpich_time(length_km, slope_percent)
         tc_hours = tc_minutes / 60
         
         # Typical range check
-        typical_range = {
-            'urban_min': 5,    # minutes
-            'urban_max': 30,   # minutes  
-            'rural_min': 30,   # minutes
-            'rural_max': 180   # minutes
-        }
+        typical_range = _CONCENTRATION_TIME_RANGES
         
         return {
             'tc_minutes': round(tc_minutes, 1),
@@ -1115,6 +1573,16 @@ class AdvancedHydrologyCalculations:
             'formula': 'tc(min) = 0.0195 L^0.77 S^-0.385'
         }
 
+    @staticmethod
+    def calculate_kirpich_time_batch(lengths_km, slopes_percent):
+        """Kirpich time of concentration (min) for many subbasins
+        
+        Either argument may be a single value shared by every entry.
+        """
+        n = _batch_size(lengths_km, slopes_percent)
+        return [_kirpich_time(length_km, slope_percent)
+                for length_km, slope_percent in zip(_as_column(lengths_km, n), _as_column(slopes_percent, n))]
+
     @staticmethod
     def calculate_channel_energy(depth, velocity):
         """Calculate specific energy and Froude number: E = y + v²/2g"""
@@ -1152,7 +1620,7 @@ class AdvancedHydrologyCalculations:
     @staticmethod
     def calculate_water_hammer(density, wave_velocity, velocity_change):
         """Calculate water hammer pressure: Δp = ρaΔV"""
-        pressure_increase = density * wave_velocity * abs(velocity_change)
+        pressure_increase = _water_hammer_pressure(density, wave_velocity, velocity_change)
         
         # Convert to more common units
         pressure_kpa = pressure_increase / 1000  # Pa to kPa
@@ -1171,17 +1639,21 @@ class AdvancedHydrologyCalculations:
             'formula': 'Δp = ρaΔV'
         }
 
+    @staticmethod
+    def calculate_water_hammer_batch(density, wave_velocity, velocity_change):
+        """Water hammer surge (Pa) over many valve closures at once
+        
+        Any argument may be a list or a single value shared by every entry.
+        Returns an unrounded list.
+        """
+        n = _batch_size(density, wave_velocity, velocity_change)
+        return [_water_hammer_pressure(rho, a, dv) for rho, a, dv in zip(_as_column(density, n), _as_column(wave_velocity, n),
+                                                                         _as_column(velocity_change, n))]
+
     @staticmethod
     def calculate_pump_similarity_laws(n1, q1, h1, p1, n2):
         """Calculate pump performance at different speeds using similarity laws"""
-        # Flow rate ratio
-        q2 = q1 * (n2 / n1)
-        
-        # Head ratio
-        h2 = h1 * (n2 / n1)**2
-        
-        # Power ratio
-        p2 = p1 * (n2 / n1)**3
+        q2, h2, p2, r = _pump_similarity(n1, q1, h1, p1, n2)
         
         # Efficiency typically remains constant (ideal case)
         eff1 = (q1 * h1 * 9.81 * 1000) / (p1 * 1000) if p1 > 0 else 0  # Rough estimation
@@ -1190,12 +1662,59 @@ class AdvancedHydrologyCalculations:
             'flow_rate_2_lps': round(q2, 2),
             'head_2_m': round(h2, 2),
             'power_2_kw': round(p2, 2),
-            'speed_ratio': round(n2/n1, 3),
+            'speed_ratio': round(r, 3),
             'estimated_efficiency_pct': round(eff1 * 100, 1),
             'original_conditions': {'Q': q1, 'H': h1, 'P': p1, 'N': n1},
             'formula': 'Q2/Q1 = N2/N1; H2/H1 = (N2/N1)²; P2/P1 = (N2/N1)³'
         }
 
+    @staticmethod
+    def calculate_pump_similarity_laws_batch(n1, q1, h1, p1, speeds):
+        """Pump flow, head and power over a sweep of speeds `speeds`
+        
+        Returns unrounded lists, one entry per speed.
+        """
+        flow_rates = []
+        heads = []
+        powers = []
+        for n2 in speeds:
+            q2, h2, p2, _ = _pump_similarity(n1, q1, h1, p1, n2)
+            flow_rates.append(q2)
+            heads.append(h2)
+            powers.append(p2)
+        
+        return {
+            'flow_rate_2_lps': flow_rates,
+            'head_2_m': heads,
+            'power_2_kw': powers
+        }
+
+
+@lru_cache(maxsize=1024)
+def _compound_growth_factor(r, period_years):
+    """Traffic growth factor [(1+r)^n - 1]/r, or n for zero growth"""
+    if r == 0:
+        # Linear growth case
+        return period_years
+    # Compound growth case
+    return ((1 + r)**period_years - 1) / r
+
+def _stopping_distance(speed_kmh, reaction_time_s, friction_coeff, grade_pct):
+    """(total, reaction, braking) stopping distances in m and the speed in m/s"""
+    v_ms = speed_kmh / 3.6  # Convert to m/s
+    g = 9.81  # gravity
+    grade_decimal = grade_pct / 100
+    
+    # Reaction distance
+    reaction_distance = v_ms * reaction_time_s
+    
+    # Braking distance; the signed grade adds to the friction uphill and
+    # subtracts from it downhill
+    braking_distance = v_ms * v_ms / (2 * g * (friction_coeff + grade_decimal))
+    
+    # Total stopping distance
+    total_distance = reaction_distance + braking_distance
+    return total_distance, reaction_distance, braking_distance, v_ms
 
 class AdvancedPavementCalculations:
     @staticmethod
@@ -1204,20 +1723,25 @@ class AdvancedPavementCalculations:
         if len(axle_loads) != len(equivalence_factors):
             raise ValueError("Axle loads and equivalence factors must have same length")
             
-        total_esal = sum(ni * ei for ni, ei in zip(axle_loads, equivalence_factors))
-        
-        # Calculate individual contributions
-        contributions = []
-        for i, (ni, ei) in enumerate(zip(axle_loads, equivalence_factors)):
-            contribution = ni * ei
-            percentage = (contribution / total_esal * 100) if total_esal > 0 else 0
-            contributions.append({
-                'axle_type': f'Type_{i+1}',
-                'count': ni,
-                'equivalence_factor': ei,
-                'esal_contribution': round(contribution, 2),
-                'percentage': round(percentage, 1)
-            })
+        # Each axle class's contribution, computed once for the total and
+        # the breakdown
+        esal_contributions = list(map(mul, axle_loads, equivalence_factors))
+        total_esal = sum(esal_contributions)
+        if total_esal > 0:
+            percentages = [contribution / total_esal * 100 for contribution in esal_contributions]
+        else:
+            percentages = [0] * len(esal_contributions)
+        
+        # Calculate individual contributions; the type number comes from a
+        # counter zipped with the columns rather than enumerate's index
+        contributions = [{
+            'axle_type': f'Type_{i}',
+            'count': ni,
+            'equivalence_factor': ei,
+            'esal_contribution': round(contribution, 2),
+            'percentage': round(percentage, 1)
+        } for i, ni, ei, contribution, percentage in zip(
+            count(1), axle_loads, equivalence_factors, esal_contributions, percentages)]
             
         return {
             'total_esal': round(total_esal, 2),
@@ -1230,19 +1754,18 @@ class AdvancedPavementCalculations:
         """Calculate accumulated traffic: Nacum = ADT0 × 365 × [(1+r)^n - 1]/r × LF × DL"""
         r = growth_rate_pct / 100
         
-        if r == 0:
-            # Linear growth case
-            growth_factor = period_years
-        else:
-            # Compound growth case
-            growth_factor = ((1 + r)**period_years - 1) / r
+        # Memoized, since design screens revisit the same few (rate, period) pairs
+        growth_factor = _compound_growth_factor(r, period_years)
             
         accumulated_traffic = adt0 * 365 * growth_factor * lane_factor * directional_factor
         
-        # Calculate year-by-year breakdown
+        # Calculate year-by-year breakdown, compounding the ADT one year at
+        # a time instead of raising (1+r) to each year's power
+        growth = 1 + r
+        yearly_adt = adt0
         yearly_breakdown = []
         for year in range(1, min(period_years + 1, 11)):  # Limit to 10 years for display
-            yearly_adt = adt0 * (1 + r)**year
+            yearly_adt *= growth
             yearly_breakdown.append({
                 'year': year,
                 'adt': round(yearly_adt, 0),
@@ -1260,35 +1783,36 @@ class AdvancedPavementCalculations:
         }
 
     @staticmethod
-    def calculate_stopping_distance(speed_kmh, reaction_time_s, friction_coeff, grade_pct=0):
-        """Calculate stopping sight distance: SSD = v·tr + v²/[2g(f±G)]"""
-        v_ms = speed_kmh / 3.6  # Convert to m/s
-        g = 9.81  # gravity
-        grade_decimal = grade_pct / 100
+    def calculate_traffic_growth_batch(adt0, growth_rates_pct, period_years, lane_factor=1.0, directional_factor=0.5):
+        """Accumulated traffic over a sweep of growth rates and/or periods
         
-        # Reaction distance
-        reaction_distance = v_ms * reaction_time_s
+        Any argument may be a list or a single value shared by every entry.
+        Returns unrounded lists.
+        """
+        n = _batch_size(adt0, growth_rates_pct, period_years, lane_factor, directional_factor)
         
-        # Braking distance
-        if grade_pct >= 0:  # Uphill grade helps braking
-            braking_distance = v_ms**2 / (2 * g * (friction_coeff + grade_decimal))
-        else:  # Downhill grade hinders braking
-            braking_distance = v_ms**2 / (2 * g * (friction_coeff - abs(grade_decimal)))
+        accumulated_traffic = []
+        growth_factors = []
+        for adt, rate_pct, years, lf, dl in zip(_as_column(adt0, n), _as_column(growth_rates_pct, n),
+                                                _as_column(period_years, n), _as_column(lane_factor, n),
+                                                _as_column(directional_factor, n)):
+            growth_factor = _compound_growth_factor(rate_pct / 100, years)
+            accumulated_traffic.append(adt * 365 * growth_factor * lf * dl)
+            growth_factors.append(growth_factor)
         
-        # Total stopping distance
-        total_distance = reaction_distance + braking_distance
+        return {
+            'accumulated_traffic': accumulated_traffic,
+            'growth_factor': growth_factors
+        }
+
+    @staticmethod
+    def calculate_stopping_distance(speed_kmh, reaction_time_s, friction_coeff, grade_pct=0):
+        """Calculate stopping sight distance: SSD = v·tr + v²/[2g(f±G)]"""
+        total_distance, reaction_distance, braking_distance, v_ms = _stopping_distance(
+            speed_kmh, reaction_time_s, friction_coeff, grade_pct)
         
         # Design recommendations
-        design_speeds = {
-            30: 35,   # km/h: stopping distance (m)
-            40: 50,
-            50: 65,
-            60: 85,
-            70: 105,
-            80: 130,
-            90: 160,
-            100: 190
-        }
+        design_speeds = _DESIGN_STOPPING_DISTANCES
         
         return {
             'total_stopping_distance_m': round(total_distance, 1),
@@ -1300,31 +1824,61 @@ class AdvancedPavementCalculations:
             'formula': 'SSD = v·tr + v²/[2g(f±G)]'
         }
 
+    @staticmethod
+    def calculate_stopping_distance_batch(speeds_kmh, reaction_time_s, friction_coeff, grade_pct=0):
+        """Stopping sight distance (m) over a table of design speeds
+        
+        Any argument may be a list or a single value shared by every entry.
+        Returns unrounded lists.
+        """
+        n = _batch_size(speeds_kmh, reaction_time_s, friction_coeff, grade_pct)
+        
+        total_distances = []
+        reaction_distances = []
+        braking_distances = []
+        for speed_kmh, tr, f, grade in zip(_as_column(speeds_kmh, n), _as_column(reaction_time_s, n),
+                                           _as_column(friction_coeff, n), _as_column(grade_pct, n)):
+            total_distance, reaction_distance, braking_distance, _ = _stopping_distance(speed_kmh, tr, f, grade)
+            total_distances.append(total_distance)
+            reaction_distances.append(reaction_distance)
+            braking_distances.append(braking_distance)
+        
+        return {
+            'total_stopping_distance_m': total_distances,
+            'reaction_distance_m': reaction_distances,
+            'braking_distance_m': braking_distances
+        }
+
+
+def _prismoidal_volume(area1, area_middle, area2, length):
+    """(prismoidal, trapezoidal) volumes in m³ of one earthwork station"""
+    volume = (length / 6) * (area1 + 4 * area_middle + area2)
+    trapezoidal_volume = (length / 2) * (area1 + area2)  # Less accurate
+    return volume, trapezoidal_volume
+
+def _lighting_design(illuminance_target, area_m2, lamp_lumens, utilization_factor, maintenance_factor):
+    """(exact count, rounded count, effective lumens, actual lux) of the lumen method"""
+    # Required total lumens
+    total_lumens_required = illuminance_target * area_m2
+    
+    # Number of luminaires needed
+    effective_lumens_per_lamp = lamp_lumens * utilization_factor * maintenance_factor
+    number_luminaires = total_lumens_required / effective_lumens_per_lamp if effective_lumens_per_lamp > 0 else 0
+    
+    # Actual illuminance with rounded number of luminaires
+    number_luminaires_rounded = math.ceil(number_luminaires)
+    actual_illuminance = (number_luminaires_rounded * effective_lumens_per_lamp) / area_m2
+    return number_luminaires, number_luminaires_rounded, effective_lumens_per_lamp, actual_illuminance
 
 class BuildingSystemsCalculations:
     @staticmethod
     def calculate_lighting_design(illuminance_target, area_m2, lamp_lumens, utilization_factor=0.6, maintenance_factor=0.8):
         """Calculate lighting using lumen method: E = Φ·UF·MF/A; Nlum = E·A/(Φlamp·UF·MF)"""
-        # Required total lumens
-        total_lumens_required = illuminance_target * area_m2
-        
-        # Number of luminaires needed
-        effective_lumens_per_lamp = lamp_lumens * utilization_factor * maintenance_factor
-        number_luminaires = total_lumens_required / effective_lumens_per_lamp if effective_lumens_per_lamp > 0 else 0
-        
-        # Actual illuminance with rounded number of luminaires
-        number_luminaires_rounded = math.ceil(number_luminaires)
-        actual_illuminance = (number_luminaires_rounded * effective_lumens_per_lamp) / area_m2
+        number_luminaires, number_luminaires_rounded, effective_lumens_per_lamp, actual_illuminance = _lighting_design(
+            illuminance_target, area_m2, lamp_lumens, utilization_factor, maintenance_factor)
         
         # Typical illuminance levels (lux)
-        typical_levels = {
-            'residence_general': 150,
-            'office_general': 500,
-            'office_tasks': 750,
-            'classroom': 300,
-            'workshop': 300,
-            'parking': 75
-        }
+        typical_levels = _TYPICAL_ILLUMINANCE_LEVELS
         
         return {
             'luminaires_needed': number_luminaires_rounded,
@@ -1336,6 +1890,32 @@ class BuildingSystemsCalculations:
             'formula': 'E = Φ·UF·MF/A; Nlum = E·A/(Φlamp·UF·MF)'
         }
 
+    @staticmethod
+    def calculate_lighting_design_batch(illuminance_targets, areas_m2, lamp_lumens, utilization_factor=0.6, maintenance_factor=0.8):
+        """Lumen-method luminaire counts over a room list × luminaire catalog
+        
+        Any argument may be a list or a single value shared by every entry.
+        Returns lists; counts are ints, the rest is unrounded.
+        """
+        n = _batch_size(illuminance_targets, areas_m2, lamp_lumens, utilization_factor, maintenance_factor)
+        
+        luminaires_needed = []
+        luminaires_exact = []
+        actual_illuminances = []
+        for target, area, lumens, uf, mf in zip(_as_column(illuminance_targets, n), _as_column(areas_m2, n),
+                                                _as_column(lamp_lumens, n), _as_column(utilization_factor, n),
+                                                _as_column(maintenance_factor, n)):
+            exact, luminaires, _, actual_illuminance = _lighting_design(target, area, lumens, uf, mf)
+            luminaires_needed.append(luminaires)
+            luminaires_exact.append(exact)
+            actual_illuminances.append(actual_illuminance)
+        
+        return {
+            'luminaires_needed': luminaires_needed,
+            'luminaires_exact': luminaires_exact,
+            'actual_illuminance_lux': actual_illuminances
+        }
+
     @staticmethod
     def calculate_thermal_transmission(u_value, area_m2, temp_difference_k):
         """Calculate heat transmission load: Q = U·A·ΔT"""
@@ -1348,15 +1928,7 @@ class BuildingSystemsCalculations:
         monthly_cost = daily_cost * 30
         
         # Typical U-values for comparison (W/m²·K)
-        typical_u_values = {
-            'wall_concrete_uninsulated': 2.5,
-            'wall_brick_uninsulated': 2.0,
-            'wall_insulated': 0.4,
-            'roof_concrete_uninsulated': 3.0,
-            'roof_insulated': 0.3,
-            'window_single_glass': 5.8,
-            'window_double_glass': 2.8
-        }
+        typical_u_values = _THERMAL_TRANSMISSION_U_VALUES
         
         return {
             'heat_loss_w': round(heat_loss_w, 1),
@@ -1375,35 +1947,25 @@ class BuildingSystemsCalculations:
         if len(absorption_coefficients) != len(surface_areas):
             raise ValueError("Absorption coefficients and surface areas must have same length")
             
-        # Calculate equivalent absorption area
-        aeq = sum(alpha * area for alpha, area in zip(absorption_coefficients, surface_areas))
+        # Calculate equivalent absorption area, keeping each surface's
+        # absorption for the breakdown below
+        absorptions = list(map(mul, absorption_coefficients, surface_areas))
+        aeq = sum(absorptions)
         
         # Reverberation time
         t60 = (0.161 * volume_m3) / aeq if aeq > 0 else 0
         
         # Recommended reverberation times (seconds)
-        recommended_times = {
-            'speech_small_room': 0.6,
-            'speech_large_room': 1.0,
-            'music_chamber': 1.4,
-            'music_concert_hall': 2.0,
-            'church': 2.5,
-            'classroom': 0.7,
-            'office': 0.5
-        }
+        recommended_times = _RECOMMENDED_REVERBERATION_TIMES
         
         # Surface breakdown
-        surface_breakdown = []
-        for i, (alpha, area) in enumerate(zip(absorption_coefficients, surface_areas)):
-            absorption = alpha * area
-            percentage = (absorption / aeq * 100) if aeq > 0 else 0
-            surface_breakdown.append({
-                'surface': f'Surface_{i+1}',
-                'alpha': alpha,
-                'area_m2': area,
-                'absorption': round(absorption, 2),
-                'percentage': round(percentage, 1)
-            })
+        surface_breakdown = [{
+            'surface': f'Surface_{i+1}',
+            'alpha': alpha,
+            'area_m2': area,
+            'absorption': round(absorption, 2),
+            'percentage': round((absorption / aeq * 100) if aeq > 0 else 0, 1)
+        } for i, (alpha, area, absorption) in enumerate(zip(absorption_coefficients, surface_areas, absorptions))]
         
         return {
             'reverberation_time_s': round(t60, 2),
@@ -1420,12 +1982,7 @@ class BuildingSystemsCalculations:
         flow_rate = rainfall_intensity * catchment_area
         
         # Typical gutter dimensions and capacities
-        gutter_capacities = {
-            100: {'diameter_mm': 100, 'capacity_ls': 2.8},
-            125: {'diameter_mm': 125, 'capacity_ls': 4.5},
-            150: {'diameter_mm': 150, 'capacity_ls': 6.8},
-            200: {'diameter_mm': 200, 'capacity_ls': 12.0}
-        }
+        gutter_capacities = _GUTTER_CAPACITIES
         
         # Find minimum gutter size
         suitable_gutters = []
@@ -1493,10 +2050,8 @@ class BuildingSystemsCalculations:
     @staticmethod
     def calculate_prismoidal_volume(area1, area_middle, area2, length):
         """Calculate prismoidal volume: V = L/6(A1 + 4Am + A2)"""
-        volume = (length / 6) * (area1 + 4 * area_middle + area2)
-        
-        # Compare with other methods
-        trapezoidal_volume = (length / 2) * (area1 + area2)  # Less accurate
+        # Compare with the trapezoidal method
+        volume, trapezoidal_volume = _prismoidal_volume(area1, area_middle, area2, length)
         average_area = (area1 + area_middle + area2) / 3
         
         # Volume distribution
@@ -1514,6 +2069,28 @@ class BuildingSystemsCalculations:
             'formula': 'V = L/6(A1 + 4Am + A2)'
         }
 
+    @staticmethod
+    def calculate_prismoidal_volume_batch(areas1, areas_middle, areas2, lengths):
+        """Prismoidal and trapezoidal volumes (m³) of many earthwork stations
+        
+        Any argument may be a list or a single value shared by every station
+        (e.g. a constant station spacing). Returns unrounded lists.
+        """
+        n = _batch_size(areas1, areas_middle, areas2, lengths)
+        
+        prismoidal_volumes = []
+        trapezoidal_volumes = []
+        for a1, am, a2, length in zip(_as_column(areas1, n), _as_column(areas_middle, n),
+                                      _as_column(areas2, n), _as_column(lengths, n)):
+            volume, trapezoidal_volume = _prismoidal_volume(a1, am, a2, length)
+            prismoidal_volumes.append(volume)
+            trapezoidal_volumes.append(trapezoidal_volume)
+        
+        return {
+            'prismoidal_volume_m3': prismoidal_volumes,
+            'trapezoidal_volume_m3': trapezoidal_volumes
+        }
+
 
 class EconomicCalculations:
     @staticmethod
@@ -1522,16 +2099,20 @@ class EconomicCalculations:
         discount_rate = discount_rate_pct / 100
         npv = -initial_investment  # Initial investment is negative cash flow
         
-        # Calculate present value of each cash flow
+        # Calculate present value of each cash flow; the discount factor
+        # 1/(1+i)^t is carried from period to period instead of a pow each
+        step = 1 / (1 + discount_rate)
+        discount_factor = 1.0
         pv_breakdown = []
         for t, cf in enumerate(cash_flows):
-            present_value = cf / ((1 + discount_rate) ** (t + 1))
+            discount_factor *= step
+            present_value = cf * discount_factor
             npv += present_value
             pv_breakdown.append({
                 'period': t + 1,
                 'cash_flow': cf,
                 'present_value': round(present_value, 2),
-                'discount_factor': round(1 / ((1 + discount_rate) ** (t + 1)), 4)
+                'discount_factor': round(discount_factor, 4)
             })
         
         # Calculate other metrics
@@ -1559,3 +2140,31 @@ class EconomicCalculations:
             'pv_breakdown': pv_breakdown,
             'formula': 'NPV = Σ[FCt/(1+i)^t] - Investment'
         }
+
+    @staticmethod
+    def calculate_npv_batch(cash_flow_scenarios, discount_rate_pct, initial_investment=0):
+        """NPV of many cash-flow scenarios (e.g. a Monte Carlo sample)
+        
+        `cash_flow_scenarios` is a list of cash-flow sequences; the rate and
+        the investment may be lists or a single value shared by every
+        scenario. The discount factors of each rate are built once and
+        reused. Returns an unrounded list.
+        """
+        n = _batch_size(cash_flow_scenarios, discount_rate_pct, initial_investment)
+        periods = max(map(len, cash_flow_scenarios), default=0)
+        
+        factors_by_rate = {}
+        npvs = []
+        for cash_flows, rate_pct, investment in zip(cash_flow_scenarios, _as_column(discount_rate_pct, n),
+                                                    _as_column(initial_investment, n)):
+            factors = factors_by_rate.get(rate_pct)
+            if factors is None:
+                step = 1 / (1 + rate_pct / 100)
+                factors = factors_by_rate[rate_pct] = []
+                discount_factor = 1.0
+                for _ in range(periods):
+                    discount_factor *= step
+                    factors.append(discount_factor)
+            npvs.append(sum(map(mul, cash_flows, factors), -investment))
+        
+        return npvs
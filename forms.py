@@ -1,226 +1,342 @@
+import json
+import re
+from datetime import date
 from flask_wtf import FlaskForm
-from wtforms import StringField, PasswordField, FloatField, SelectField, TextAreaField, SubmitField, DateField, IntegerField, HiddenField
+from wtforms import StringField, PasswordField, FloatField, SelectField, TextAreaField, DateField, IntegerField
 from wtforms.validators import DataRequired, Email, Length, NumberRange, EqualTo, Optional
 
+# WTForms only imports email_validator (and dnspython) inside Email.__call__,
+# so building the forms never loads it; one shared instance serves every
+# email field
+_EMAIL = Email()
+
+# Validators are stateless (__call__(form, field) only reads its arguments),
+# so the common ones are built once and shared by every field
+_REQ = DataRequired()
+_OPT = Optional()
+
+# Validator sequences repeated across many fields, shared as one tuple each
+_V_REQ = (_REQ,)
+_V_OPT = (_OPT,)
+
+class CSVFloatField(TextAreaField):
+    """Text area of comma-separated numbers, one row per line
+
+    The text is parsed once while the form processes its input, so views
+    read `field.data` as a tuple of numbers (or of `row_size`-long tuples)
+    and a malformed entry is reported as a validation error on the field.
+    Scripts that already hold the rows can submit them as a JSON array
+    instead, e.g. `[[10, 3.0, 20], [12, 6.0, 10]]`.
+    """
+
+    def __init__(self, label=None, validators=None, row_size=1, coerce=float, **kwargs):
+        super().__init__(label, validators, **kwargs)
+        self.row_size = row_size
+        self.coerce = coerce
+
+    def _value(self):
+        if self.raw_data:
+            return self.raw_data[0]
+        if not self.data:
+            return ''
+        if self.row_size == 1:
+            return '\n'.join(map(str, self.data))
+        return '\n'.join(','.join(map(str, row)) for row in self.data)
+
+    def process_formdata(self, valuelist):
+        if not valuelist:
+            return
+        # Keep the raw text until it parses, so that DataRequired does not
+        # replace the parse error with its own message
+        text = self.data = valuelist[0]
+        if text.lstrip().startswith('['):
+            self.data = self._parse_json(text)
+            return
+        coerce = self.coerce
+        row_size = self.row_size
+        rows = []
+        for line in text.splitlines():
+            if not line.strip():
+                continue
+            try:
+                row = tuple(map(coerce, line.split(',')))
+            except ValueError:
+                raise ValueError(self.gettext('Invalid number: %s') % line.strip())
+            if len(row) != row_size:
+                raise ValueError(self.gettext('Expected %d values per line: %s') % (row_size, line.strip()))
+            rows.append(row if row_size > 1 else row[0])
+        self.data = tuple(rows)
+
+    def _parse_json(self, text):
+        """Rows from a JSON array, held to the same shape and number type"""
+        try:
+            items = json.loads(text)
+        except ValueError:
+            raise ValueError(self.gettext('Invalid JSON array'))
+        coerce = self.coerce
+        row_size = self.row_size
+        rows = []
+        for item in items:
+            row = item if row_size > 1 else [item]
+            if not isinstance(row, list) or len(row) != row_size:
+                raise ValueError(self.gettext('Expected %d values per line: %s') % (row_size, json.dumps(item)))
+            values = []
+            for value in row:
+                if isinstance(value, bool) or not isinstance(value, (int, float)) or coerce(value) != value:
+                    raise ValueError(self.gettext('Invalid number: %s') % json.dumps(value))
+                values.append(coerce(value))
+            rows.append(tuple(values) if row_size > 1 else values[0])
+        return tuple(rows)
+
+# Separators of a one-line number list; a list typed with semicolons is
+# taken to use the decimal comma, as pt-BR spreadsheets export it
+_LIST_SPLIT = re.compile(r'[,\s]+')
+_LIST_SPLIT_SEMI = re.compile(r'\s*;\s*')
+
+class FloatListField(StringField):
+    """Single-line list of numbers, e.g. `1000, 1200, 1500`
+
+    Parsed once while the form processes its input, so views read
+    `field.data` as a tuple of floats.
+    """
+
+    def _value(self):
+        if self.raw_data:
+            return self.raw_data[0]
+        return ', '.join(map(str, self.data)) if self.data else ''
+
+    def process_formdata(self, valuelist):
+        if not valuelist:
+            return
+        # Raw text until it parses, as in CSVFloatField
+        text = self.data = valuelist[0].strip()
+        if ';' in text:
+            items = _LIST_SPLIT_SEMI.split(text.replace(',', '.'))
+        else:
+            items = _LIST_SPLIT.split(text)
+        values = []
+        for item in items:
+            if not item:
+                continue
+            try:
+                values.append(float(item))
+            except ValueError:
+                raise ValueError(self.gettext('Invalid number: %s') % item)
+        self.data = tuple(values)
+
+class FastDateField(DateField):
+    """DateField that parses the browser's YYYY-MM-DD value with the C
+    date.fromisoformat, falling back to strptime for anything else"""
+
+    def process_formdata(self, valuelist):
+        if len(valuelist) == 1:
+            value = valuelist[0]
+            if len(value) == 10 and value[4] == '-' and value[7] == '-':
+                try:
+                    self.data = date.fromisoformat(value)
+                    return
+                except ValueError:
+                    pass
+        super().process_formdata(valuelist)
+
+# Choice lists shared by the project management forms; tuples, so every
+# SelectField reuses the same object
+_PROJECT_STATUS_CHOICES = (
+    ('planejamento', 'Planejamento'),
+    ('execucao', 'Execução'),
+    ('concluido', 'Concluído'),
+    ('cancelado', 'Cancelado')
+)
+_BUDGET_STATUS_CHOICES = (
+    ('rascunho', 'Rascunho'),
+    ('revisao', 'Em Revisão'),
+    ('aprovado', 'Aprovado')
+)
+_WORK_UNIT_CHOICES = (
+    ('m²', 'm²'), ('m³', 'm³'), ('m', 'm'), ('un', 'un'),
+    ('kg', 'kg'), ('t', 't'), ('h', 'h'), ('vb', 'vb')
+)
+_WORK_CATEGORY_CHOICES = (
+    ('estrutura', 'Estrutura'),
+    ('fundacao', 'Fundação'),
+    ('acabamento', 'Acabamento'),
+    ('instalacoes', 'Instalações'),
+    ('movimento_terra', 'Movimento de Terra'),
+    ('outros', 'Outros')
+)
+_MATERIAL_CATEGORY_CHOICES = (
+    ('cimento', 'Cimento'),
+    ('areia', 'Areia'),
+    ('brita', 'Brita'),
+    ('aco', 'Aço'),
+    ('blocos', 'Blocos'),
+    ('tubulacao', 'Tubulação'),
+    ('madeira', 'Madeira'),
+    ('ceramica', 'Cerâmica'),
+    ('tinta', 'Tinta'),
+    ('outros', 'Outros')
+)
+_MATERIAL_UNIT_CHOICES = (
+    ('kg', 'kg'), ('t', 't'), ('m³', 'm³'), ('m²', 'm²'),
+    ('m', 'm'), ('un', 'un'), ('L', 'L'), ('saca', 'saca')
+)
+
 class LoginForm(FlaskForm):
-    email = StringField('Email', validators=[DataRequired(), Email()])
-    password = PasswordField('Senha', validators=[DataRequired()])
-    submit = SubmitField('Entrar')
+    email = StringField('Email', validators=(_REQ, _EMAIL))
+    password = PasswordField('Senha', validators=_V_REQ)
 
 class RegisterForm(FlaskForm):
-    name = StringField('Nome Completo', validators=[DataRequired(), Length(min=2, max=100)])
-    email = StringField('Email', validators=[DataRequired(), Email()])
-    password = PasswordField('Senha', validators=[DataRequired(), Length(min=6)])
+    name = StringField('Nome Completo', validators=(_REQ, Length(min=2, max=100)))
+    email = StringField('Email', validators=(_REQ, _EMAIL))
+    password = PasswordField('Senha', validators=(_REQ, Length(min=6)))
     password2 = PasswordField('Confirmar Senha', 
-                              validators=[DataRequired(), EqualTo('password')])
-    submit = SubmitField('Cadastrar')
+                              validators=(_REQ, EqualTo('password')))
 
 class BeamCalculationForm(FlaskForm):
-    name = StringField('Nome do Cálculo', validators=[DataRequired()])
-    length = FloatField('Comprimento da Viga (m)', validators=[DataRequired(), NumberRange(min=0.1)])
+    name = StringField('Nome do Cálculo', validators=_V_REQ)
+    length = FloatField('Comprimento da Viga (m)', validators=(_REQ, NumberRange(min=0.1)))
     load_type = SelectField('Tipo de Carregamento', 
                            choices=[('uniform', 'Uniformemente Distribuída'), 
                                    ('point', 'Carga Pontual no Centro')])
-    load_value = FloatField('Valor da Carga', validators=[DataRequired(), NumberRange(min=0)])
+    load_value = FloatField('Valor da Carga', validators=(_REQ, NumberRange(min=0)))
     load_unit = SelectField('Unidade', choices=[('kN/m', 'kN/m'), ('kN', 'kN')])
-    submit = SubmitField('Calcular')
 
 class ConcreteBeamForm(FlaskForm):
-    name = StringField('Nome do Cálculo', validators=[DataRequired()])
-    width = FloatField('Largura da Seção (cm)', validators=[DataRequired(), NumberRange(min=1)])
-    height = FloatField('Altura da Seção (cm)', validators=[DataRequired(), NumberRange(min=1)])
-    moment = FloatField('Momento de Projeto (kN.m)', validators=[DataRequired(), NumberRange(min=0)])
-    fck = FloatField('fck (MPa)', validators=[DataRequired(), NumberRange(min=10, max=50)])
-    fyk = FloatField('fyk (MPa)', validators=[DataRequired(), NumberRange(min=250, max=600)])
-    submit = SubmitField('Calcular')
+    name = StringField('Nome do Cálculo', validators=_V_REQ)
+    width = FloatField('Largura da Seção (cm)', validators=(_REQ, NumberRange(min=1)))
+    height = FloatField('Altura da Seção (cm)', validators=(_REQ, NumberRange(min=1)))
+    moment = FloatField('Momento de Projeto (kN.m)', validators=(_REQ, NumberRange(min=0)))
+    fck = FloatField('fck (MPa)', validators=(_REQ, NumberRange(min=10, max=50)))
+    fyk = FloatField('fyk (MPa)', validators=(_REQ, NumberRange(min=250, max=600)))
 
 class HydraulicsForm(FlaskForm):
-    name = StringField('Nome do Cálculo', validators=[DataRequired()])
-    pipe_diameter = FloatField('Diâmetro da Tubulação (mm)', validators=[DataRequired(), NumberRange(min=10)])
-    pipe_length = FloatField('Comprimento (m)', validators=[DataRequired(), NumberRange(min=0.1)])
-    flow_rate = FloatField('Vazão (L/s)', validators=[DataRequired(), NumberRange(min=0.1)])
-    roughness = FloatField('Rugosidade (mm)', validators=[DataRequired(), NumberRange(min=0.001)])
-    submit = SubmitField('Calcular')
+    name = StringField('Nome do Cálculo', validators=_V_REQ)
+    pipe_diameter = FloatField('Diâmetro da Tubulação (mm)', validators=(_REQ, NumberRange(min=10)))
+    pipe_length = FloatField('Comprimento (m)', validators=(_REQ, NumberRange(min=0.1)))
+    flow_rate = FloatField('Vazão (L/s)', validators=(_REQ, NumberRange(min=0.1)))
+    roughness = FloatField('Rugosidade (mm)', validators=(_REQ, NumberRange(min=0.001)))
 
 class FoundationForm(FlaskForm):
-    name = StringField('Nome do Cálculo', validators=[DataRequired()])
-    width = FloatField('Largura da Sapata (m)', validators=[DataRequired(), NumberRange(min=0.1)])
-    cohesion = FloatField('Coesão do Solo (kPa)', validators=[DataRequired(), NumberRange(min=0)])
-    friction_angle = FloatField('Ângulo de Atrito (graus)', validators=[DataRequired(), NumberRange(min=0, max=45)])
-    unit_weight = FloatField('Peso Específico do Solo (kN/m³)', validators=[DataRequired(), NumberRange(min=10, max=25)])
-    depth = FloatField('Profundidade da Fundação (m)', validators=[DataRequired(), NumberRange(min=0.5)])
-    submit = SubmitField('Calcular')
+    name = StringField('Nome do Cálculo', validators=_V_REQ)
+    width = FloatField('Largura da Sapata (m)', validators=(_REQ, NumberRange(min=0.1)))
+    cohesion = FloatField('Coesão do Solo (kPa)', validators=(_REQ, NumberRange(min=0)))
+    friction_angle = FloatField('Ângulo de Atrito (graus)', validators=(_REQ, NumberRange(min=0, max=45)))
+    unit_weight = FloatField('Peso Específico do Solo (kN/m³)', validators=(_REQ, NumberRange(min=10, max=25)))
+    depth = FloatField('Profundidade da Fundação (m)', validators=(_REQ, NumberRange(min=0.5)))
 
 class TopographyForm(FlaskForm):
-    name = StringField('Nome do Cálculo', validators=[DataRequired()])
-    coordinates = TextAreaField('Coordenadas (x,y por linha)', 
-                               validators=[DataRequired()],
+    name = StringField('Nome do Cálculo', validators=_V_REQ)
+    coordinates = CSVFloatField('Coordenadas (x,y por linha)', 
+                               validators=_V_REQ, row_size=2,
                                render_kw={"placeholder": "Digite as coordenadas separadas por vírgula, uma por linha:\nx1,y1\nx2,y2\nx3,y3"})
-    submit = SubmitField('Calcular')
 
 # Project Management Forms
 class ProjectForm(FlaskForm):
-    name = StringField('Nome do Projeto', validators=[DataRequired(), Length(min=2, max=200)])
-    client_name = StringField('Nome do Cliente', validators=[DataRequired(), Length(min=2, max=200)])
-    client_email = StringField('Email do Cliente', validators=[Optional(), Email()])
-    client_phone = StringField('Telefone do Cliente', validators=[Optional(), Length(max=20)])
-    address = TextAreaField('Endereço da Obra', validators=[DataRequired()])
-    technical_responsible = StringField('Responsável Técnico', validators=[DataRequired(), Length(min=2, max=200)])
-    crea_number = StringField('Número do CREA', validators=[Optional(), Length(max=50)])
-    start_date = DateField('Data de Início', validators=[DataRequired()])
-    end_date = DateField('Data de Término', validators=[DataRequired()])
+    name = StringField('Nome do Projeto', validators=(_REQ, Length(min=2, max=200)))
+    client_name = StringField('Nome do Cliente', validators=(_REQ, Length(min=2, max=200)))
+    client_email = StringField('Email do Cliente', validators=(_OPT, _EMAIL))
+    client_phone = StringField('Telefone do Cliente', validators=(_OPT, Length(max=20)))
+    address = TextAreaField('Endereço da Obra', validators=_V_REQ)
+    technical_responsible = StringField('Responsável Técnico', validators=(_REQ, Length(min=2, max=200)))
+    crea_number = StringField('Número do CREA', validators=(_OPT, Length(max=50)))
+    start_date = FastDateField('Data de Início', validators=_V_REQ)
+    end_date = FastDateField('Data de Término', validators=_V_REQ)
     description = TextAreaField('Descrição do Projeto')
-    status = SelectField('Status', choices=[
-        ('planejamento', 'Planejamento'),
-        ('execucao', 'Execução'),
-        ('concluido', 'Concluído'),
-        ('cancelado', 'Cancelado')
-    ])
-    submit = SubmitField('Salvar Projeto')
+    status = SelectField('Status', choices=_PROJECT_STATUS_CHOICES)
 
 class BudgetForm(FlaskForm):
-    name = StringField('Nome do Orçamento', validators=[DataRequired(), Length(min=2, max=200)])
-    version = StringField('Versão', validators=[DataRequired(), Length(max=10)])
+    name = StringField('Nome do Orçamento', validators=(_REQ, Length(min=2, max=200)))
+    version = StringField('Versão', validators=(_REQ, Length(max=10)))
     description = TextAreaField('Descrição')
-    profit_margin = FloatField('Margem de Lucro (%)', validators=[DataRequired(), NumberRange(min=0, max=100)])
-    status = SelectField('Status', choices=[
-        ('rascunho', 'Rascunho'),
-        ('revisao', 'Em Revisão'),
-        ('aprovado', 'Aprovado')
-    ])
-    submit = SubmitField('Salvar Orçamento')
+    profit_margin = FloatField('Margem de Lucro (%)', validators=(_REQ, NumberRange(min=0, max=100)))
+    status = SelectField('Status', choices=_BUDGET_STATUS_CHOICES)
 
 class BudgetItemForm(FlaskForm):
-    description = StringField('Descrição', validators=[DataRequired(), Length(min=2, max=500)])
-    unit = SelectField('Unidade', choices=[
-        ('m²', 'm²'), ('m³', 'm³'), ('m', 'm'), ('un', 'un'), 
-        ('kg', 'kg'), ('t', 't'), ('h', 'h'), ('vb', 'vb')
-    ])
-    quantity = FloatField('Quantidade', validators=[DataRequired(), NumberRange(min=0.001)])
-    unit_cost = FloatField('Custo Unitário (R$)', validators=[DataRequired(), NumberRange(min=0)])
-    category = SelectField('Categoria', choices=[
-        ('estrutura', 'Estrutura'),
-        ('fundacao', 'Fundação'),
-        ('acabamento', 'Acabamento'),
-        ('instalacoes', 'Instalações'),
-        ('movimento_terra', 'Movimento de Terra'),
-        ('outros', 'Outros')
-    ])
+    description = StringField('Descrição', validators=(_REQ, Length(min=2, max=500)))
+    unit = SelectField('Unidade', choices=_WORK_UNIT_CHOICES)
+    quantity = FloatField('Quantidade', validators=(_REQ, NumberRange(min=0.001)))
+    unit_cost = FloatField('Custo Unitário (R$)', validators=(_REQ, NumberRange(min=0)))
+    category = SelectField('Categoria', choices=_WORK_CATEGORY_CHOICES)
     notes = TextAreaField('Observações')
-    submit = SubmitField('Adicionar Item')
 
 class MaterialForm(FlaskForm):
-    name = StringField('Nome do Material', validators=[DataRequired(), Length(min=2, max=200)])
-    category = SelectField('Categoria', choices=[
-        ('cimento', 'Cimento'),
-        ('areia', 'Areia'),
-        ('brita', 'Brita'),
-        ('aco', 'Aço'),
-        ('blocos', 'Blocos'),
-        ('tubulacao', 'Tubulação'),
-        ('madeira', 'Madeira'),
-        ('ceramica', 'Cerâmica'),
-        ('tinta', 'Tinta'),
-        ('outros', 'Outros')
-    ])
-    unit = SelectField('Unidade', choices=[
-        ('kg', 'kg'), ('t', 't'), ('m³', 'm³'), ('m²', 'm²'), 
-        ('m', 'm'), ('un', 'un'), ('L', 'L'), ('saca', 'saca')
-    ])
-    unit_cost = FloatField('Custo Unitário (R$)', validators=[DataRequired(), NumberRange(min=0)])
-    supplier = StringField('Fornecedor', validators=[Optional(), Length(max=200)])
-    submit = SubmitField('Salvar Material')
+    name = StringField('Nome do Material', validators=(_REQ, Length(min=2, max=200)))
+    category = SelectField('Categoria', choices=_MATERIAL_CATEGORY_CHOICES)
+    unit = SelectField('Unidade', choices=_MATERIAL_UNIT_CHOICES)
+    unit_cost = FloatField('Custo Unitário (R$)', validators=(_REQ, NumberRange(min=0)))
+    supplier = StringField('Fornecedor', validators=(_OPT, Length(max=200)))
 
 class CostCompositionForm(FlaskForm):
-    sinapi_code = StringField('Código SINAPI', validators=[Optional(), Length(max=20)])
-    tcpo_code = StringField('Código TCPO', validators=[Optional(), Length(max=20)])
-    description = StringField('Descrição', validators=[DataRequired(), Length(min=2, max=500)])
-    unit = SelectField('Unidade', choices=[
-        ('m²', 'm²'), ('m³', 'm³'), ('m', 'm'), ('un', 'un'), 
-        ('kg', 'kg'), ('t', 't'), ('h', 'h'), ('vb', 'vb')
-    ])
-    unit_cost = FloatField('Custo Unitário (R$)', validators=[DataRequired(), NumberRange(min=0)])
-    productivity = FloatField('Produtividade (h/un)', validators=[Optional(), NumberRange(min=0)])
-    category = SelectField('Categoria', choices=[
-        ('estrutura', 'Estrutura'),
-        ('fundacao', 'Fundação'),
-        ('acabamento', 'Acabamento'),
-        ('instalacoes', 'Instalações'),
-        ('movimento_terra', 'Movimento de Terra'),
-        ('outros', 'Outros')
-    ])
-    submit = SubmitField('Salvar Composição')
+    sinapi_code = StringField('Código SINAPI', validators=(_OPT, Length(max=20)))
+    tcpo_code = StringField('Código TCPO', validators=(_OPT, Length(max=20)))
+    description = StringField('Descrição', validators=(_REQ, Length(min=2, max=500)))
+    unit = SelectField('Unidade', choices=_WORK_UNIT_CHOICES)
+    unit_cost = FloatField('Custo Unitário (R$)', validators=(_REQ, NumberRange(min=0)))
+    productivity = FloatField('Produtividade (h/un)', validators=(_OPT, NumberRange(min=0)))
+    category = SelectField('Categoria', choices=_WORK_CATEGORY_CHOICES)
 
 class ScheduleActivityForm(FlaskForm):
-    name = StringField('Nome da Atividade', validators=[DataRequired(), Length(min=2, max=200)])
+    name = StringField('Nome da Atividade', validators=(_REQ, Length(min=2, max=200)))
     description = TextAreaField('Descrição')
-    duration = IntegerField('Duração (dias)', validators=[DataRequired(), NumberRange(min=1)])
-    responsible = StringField('Responsável', validators=[Optional(), Length(max=200)])
-    cost = FloatField('Custo (R$)', validators=[Optional(), NumberRange(min=0)])
-    predecessors = StringField('Atividades Predecessoras (IDs separados por vírgula)', validators=[Optional()])
-    submit = SubmitField('Adicionar Atividade')
+    duration = IntegerField('Duração (dias)', validators=(_REQ, NumberRange(min=1)))
+    responsible = StringField('Responsável', validators=(_OPT, Length(max=200)))
+    cost = FloatField('Custo (R$)', validators=(_OPT, NumberRange(min=0)))
+    predecessors = StringField('Atividades Predecessoras (IDs separados por vírgula)', validators=_V_OPT)
 
 # Geotechnical Forms
 class EarthPressureForm(FlaskForm):
-    name = StringField('Nome do Cálculo', validators=[DataRequired()])
+    name = StringField('Nome do Cálculo', validators=_V_REQ)
     pressure_type = SelectField('Tipo de Empuxo', choices=[
         ('active', 'Empuxo Ativo'),
         ('passive', 'Empuxo Passivo')
     ])
-    unit_weight = FloatField('Peso Específico do Solo (kN/m³)', validators=[DataRequired(), NumberRange(min=10, max=25)])
-    height = FloatField('Altura do Muro (m)', validators=[DataRequired(), NumberRange(min=0.5, max=20)])
-    friction_angle = FloatField('Ângulo de Atrito (graus)', validators=[DataRequired(), NumberRange(min=0, max=45)])
-    cohesion = FloatField('Coesão do Solo (kPa)', validators=[Optional(), NumberRange(min=0)])
-    submit = SubmitField('Calcular')
+    unit_weight = FloatField('Peso Específico do Solo (kN/m³)', validators=(_REQ, NumberRange(min=10, max=25)))
+    height = FloatField('Altura do Muro (m)', validators=(_REQ, NumberRange(min=0.5, max=20)))
+    friction_angle = FloatField('Ângulo de Atrito (graus)', validators=(_REQ, NumberRange(min=0, max=45)))
+    cohesion = FloatField('Coesão do Solo (kPa)', validators=(_OPT, NumberRange(min=0)))
 
 class SettlementForm(FlaskForm):
-    name = StringField('Nome do Cálculo', validators=[DataRequired()])
-    consolidation_coeff = FloatField('Coeficiente de Adensamento (m²/ano)', validators=[DataRequired(), NumberRange(min=0.001, max=100)])
-    time_days = FloatField('Tempo (dias)', validators=[DataRequired(), NumberRange(min=1, max=36500)])
-    layer_height = FloatField('Altura da Camada (m)', validators=[DataRequired(), NumberRange(min=0.1, max=50)])
-    submit = SubmitField('Calcular')
+    name = StringField('Nome do Cálculo', validators=_V_REQ)
+    consolidation_coeff = FloatField('Coeficiente de Adensamento (m²/ano)', validators=(_REQ, NumberRange(min=0.001, max=100)))
+    time_days = FloatField('Tempo (dias)', validators=(_REQ, NumberRange(min=1, max=36500)))
+    layer_height = FloatField('Altura da Camada (m)', validators=(_REQ, NumberRange(min=0.1, max=50)))
 
 # Pavement Forms
 class PavementCBRForm(FlaskForm):
-    name = StringField('Nome do Cálculo', validators=[DataRequired()])
-    traffic_load = FloatField('Carga de Tráfego Equivalente', validators=[DataRequired(), NumberRange(min=1000)])
-    cbr_value = FloatField('Valor CBR (%)', validators=[DataRequired(), NumberRange(min=2, max=100)])
-    k_constant = FloatField('Constante K', validators=[Optional(), NumberRange(min=0.1, max=5)], default=1.0)
-    submit = SubmitField('Calcular')
+    name = StringField('Nome do Cálculo', validators=_V_REQ)
+    traffic_load = FloatField('Carga de Tráfego Equivalente', validators=(_REQ, NumberRange(min=1000)))
+    cbr_value = FloatField('Valor CBR (%)', validators=(_REQ, NumberRange(min=2, max=100)))
+    k_constant = FloatField('Constante K', validators=(_OPT, NumberRange(min=0.1, max=5)), default=1.0)
 
 class EarthworkForm(FlaskForm):
-    name = StringField('Nome do Cálculo', validators=[DataRequired()])
-    length = FloatField('Comprimento (m)', validators=[DataRequired(), NumberRange(min=0.1)])
-    area1 = FloatField('Área da Seção 1 (m²)', validators=[DataRequired(), NumberRange(min=0)])
-    area2 = FloatField('Área da Seção 2 (m²)', validators=[DataRequired(), NumberRange(min=0)])
-    submit = SubmitField('Calcular')
+    name = StringField('Nome do Cálculo', validators=_V_REQ)
+    length = FloatField('Comprimento (m)', validators=(_REQ, NumberRange(min=0.1)))
+    area1 = FloatField('Área da Seção 1 (m²)', validators=(_REQ, NumberRange(min=0)))
+    area2 = FloatField('Área da Seção 2 (m²)', validators=(_REQ, NumberRange(min=0)))
 
 class TrafficESALForm(FlaskForm):
-    name = StringField('Nome do Cálculo', validators=[DataRequired()])
-    axle_loads = TextAreaField('Cargas por Eixo (tons, uma por linha)', validators=[DataRequired()],
+    name = StringField('Nome do Cálculo', validators=_V_REQ)
+    axle_loads = CSVFloatField('Cargas por Eixo (tons, uma por linha)', validators=_V_REQ,
                               render_kw={"placeholder": "Digite as cargas em toneladas, uma por linha:\n8.2\n12.0\n16.0"})
-    repetitions = TextAreaField('Repetições por Eixo (uma por linha)', validators=[DataRequired()],
+    repetitions = CSVFloatField('Repetições por Eixo (uma por linha)', validators=_V_REQ, coerce=int,
                                render_kw={"placeholder": "Digite as repetições, uma por linha:\n1000000\n500000\n200000"})
-    submit = SubmitField('Calcular')
 
 # Quantity Calculation Forms
 class ConcreteVolumeForm(FlaskForm):
-    name = StringField('Nome do Cálculo', validators=[DataRequired()])
-    length = FloatField('Comprimento (m)', validators=[DataRequired(), NumberRange(min=0.1)])
-    width = FloatField('Largura (m)', validators=[DataRequired(), NumberRange(min=0.1)])
-    height = FloatField('Altura (m)', validators=[DataRequired(), NumberRange(min=0.05)])
-    submit = SubmitField('Calcular')
+    name = StringField('Nome do Cálculo', validators=_V_REQ)
+    length = FloatField('Comprimento (m)', validators=(_REQ, NumberRange(min=0.1)))
+    width = FloatField('Largura (m)', validators=(_REQ, NumberRange(min=0.1)))
+    height = FloatField('Altura (m)', validators=(_REQ, NumberRange(min=0.05)))
 
 class SteelConsumptionForm(FlaskForm):
-    name = StringField('Nome do Cálculo', validators=[DataRequired()])
-    steel_bars = TextAreaField('Barras de Aço (diâmetro,comprimento,quantidade por linha)', 
-                              validators=[DataRequired()],
+    name = StringField('Nome do Cálculo', validators=_V_REQ)
+    steel_bars = CSVFloatField('Barras de Aço (diâmetro,comprimento,quantidade por linha)', 
+                              validators=_V_REQ, row_size=3,
                               render_kw={"placeholder": "Digite: diâmetro(mm),comprimento(m),quantidade\n10,3.0,20\n12,6.0,10\n16,4.5,8"})
-    submit = SubmitField('Calcular')
 
 class MortarForm(FlaskForm):
-    name = StringField('Nome do Cálculo', validators=[DataRequired()])
-    volume_m3 = FloatField('Volume de Argamassa (m³)', validators=[DataRequired(), NumberRange(min=0.001)])
+    name = StringField('Nome do Cálculo', validators=_V_REQ)
+    volume_m3 = FloatField('Volume de Argamassa (m³)', validators=(_REQ, NumberRange(min=0.001)))
     mix_ratio = SelectField('Traço', choices=[
         ('1:3', '1:3 (Cimento:Areia)'),
         ('1:4', '1:4 (Cimento:Areia)'),
@@ -228,153 +344,106 @@ class MortarForm(FlaskForm):
         ('1:5:1', '1:5:1 (Cimento:Areia:Cal)'),
         ('1:6:1', '1:6:1 (Cimento:Areia:Cal)')
     ])
-    submit = SubmitField('Calcular')
 
 # Masonry Forms
 class BrickConsumptionForm(FlaskForm):
-    name = StringField('Nome do Cálculo', validators=[DataRequired()])
-    wall_area = FloatField('Área da Parede (m²)', validators=[DataRequired(), NumberRange(min=0.1)])
-    brick_length = FloatField('Comprimento do Tijolo (cm)', validators=[Optional(), NumberRange(min=5, max=50)], default=19)
-    brick_height = FloatField('Altura do Tijolo (cm)', validators=[Optional(), NumberRange(min=5, max=20)], default=9)
-    mortar_joint = FloatField('Espessura da Junta (cm)', validators=[Optional(), NumberRange(min=0.5, max=3)], default=1)
-    submit = SubmitField('Calcular')
+    name = StringField('Nome do Cálculo', validators=_V_REQ)
+    wall_area = FloatField('Área da Parede (m²)', validators=(_REQ, NumberRange(min=0.1)))
+    brick_length = FloatField('Comprimento do Tijolo (cm)', validators=(_OPT, NumberRange(min=5, max=50)), default=19)
+    brick_height = FloatField('Altura do Tijolo (cm)', validators=(_OPT, NumberRange(min=5, max=20)), default=9)
+    mortar_joint = FloatField('Espessura da Junta (cm)', validators=(_OPT, NumberRange(min=0.5, max=3)), default=1)
 
 class WallLoadForm(FlaskForm):
-    name = StringField('Nome do Cálculo', validators=[DataRequired()])
-    applied_load = FloatField('Carga Aplicada (kN)', validators=[DataRequired(), NumberRange(min=0.1)])
-    wall_area = FloatField('Área da Parede (m²)', validators=[DataRequired(), NumberRange(min=0.01)])
-    submit = SubmitField('Calcular')
+    name = StringField('Nome do Cálculo', validators=_V_REQ)
+    applied_load = FloatField('Carga Aplicada (kN)', validators=(_REQ, NumberRange(min=0.1)))
+    wall_area = FloatField('Área da Parede (m²)', validators=(_REQ, NumberRange(min=0.01)))
 
 # Sanitation Forms
 class RationalMethodForm(FlaskForm):
-    name = StringField('Nome do Cálculo', validators=[DataRequired()])
-    runoff_coeff = FloatField('Coeficiente de Escoamento (C)', validators=[DataRequired(), NumberRange(min=0.1, max=1.0)])
-    intensity = FloatField('Intensidade da Chuva (mm/h)', validators=[DataRequired(), NumberRange(min=1, max=300)])
-    area = FloatField('Área da Bacia (ha)', validators=[DataRequired(), NumberRange(min=0.01)])
-    submit = SubmitField('Calcular')
+    name = StringField('Nome do Cálculo', validators=_V_REQ)
+    runoff_coeff = FloatField('Coeficiente de Escoamento (C)', validators=(_REQ, NumberRange(min=0.1, max=1.0)))
+    intensity = FloatField('Intensidade da Chuva (mm/h)', validators=(_REQ, NumberRange(min=1, max=300)))
+    area = FloatField('Área da Bacia (ha)', validators=(_REQ, NumberRange(min=0.01)))
 
 class ManningForm(FlaskForm):
-    name = StringField('Nome do Cálculo', validators=[DataRequired()])
-    hydraulic_radius = FloatField('Raio Hidráulico (m)', validators=[DataRequired(), NumberRange(min=0.01, max=10)])
-    slope = FloatField('Declividade (m/m)', validators=[DataRequired(), NumberRange(min=0.0001, max=1)])
-    manning_n = FloatField('Coeficiente de Manning (n)', validators=[DataRequired(), NumberRange(min=0.01, max=0.2)])
-    submit = SubmitField('Calcular')
+    name = StringField('Nome do Cálculo', validators=_V_REQ)
+    hydraulic_radius = FloatField('Raio Hidráulico (m)', validators=(_REQ, NumberRange(min=0.01, max=10)))
+    slope = FloatField('Declividade (m/m)', validators=(_REQ, NumberRange(min=0.0001, max=1)))
+    manning_n = FloatField('Coeficiente de Manning (n)', validators=(_REQ, NumberRange(min=0.01, max=0.2)))
 
 class DarcyWeisbachForm(FlaskForm):
-    name = StringField('Nome do Cálculo', validators=[DataRequired()])
-    friction_factor = FloatField('Fator de Atrito (f)', validators=[DataRequired(), NumberRange(min=0.01, max=0.1)])
-    length = FloatField('Comprimento da Tubulação (m)', validators=[DataRequired(), NumberRange(min=0.1)])
-    diameter = FloatField('Diâmetro (m)', validators=[DataRequired(), NumberRange(min=0.01, max=5)])
-    velocity = FloatField('Velocidade (m/s)', validators=[DataRequired(), NumberRange(min=0.1, max=10)])
-    submit = SubmitField('Calcular')
+    name = StringField('Nome do Cálculo', validators=_V_REQ)
+    friction_factor = FloatField('Fator de Atrito (f)', validators=(_REQ, NumberRange(min=0.01, max=0.1)))
+    length = FloatField('Comprimento da Tubulação (m)', validators=(_REQ, NumberRange(min=0.1)))
+    diameter = FloatField('Diâmetro (m)', validators=(_REQ, NumberRange(min=0.01, max=5)))
+    velocity = FloatField('Velocidade (m/s)', validators=(_REQ, NumberRange(min=0.1, max=10)))
 
 # Advanced Structural Forms
 class TorsionShearForm(FlaskForm):
-    name = StringField('Nome do Cálculo', validators=[DataRequired()])
-    torque = FloatField('Torque (kN.m)', validators=[DataRequired(), NumberRange(min=0.1)])
-    c_distance = FloatField('Distância ao Centroide (mm)', validators=[DataRequired(), NumberRange(min=1)])
-    polar_moment = FloatField('Momento Polar de Inércia (mm⁴)', validators=[DataRequired(), NumberRange(min=1)])
-    submit = SubmitField('Calcular')
+    name = StringField('Nome do Cálculo', validators=_V_REQ)
+    torque = FloatField('Torque (kN.m)', validators=(_REQ, NumberRange(min=0.1)))
+    c_distance = FloatField('Distância ao Centroide (mm)', validators=(_REQ, NumberRange(min=1)))
+    polar_moment = FloatField('Momento Polar de Inércia (mm⁴)', validators=(_REQ, NumberRange(min=1)))
 
 # EulerBucklingForm moved to Advanced section below
 
 class ContinuousBeamForm(FlaskForm):
-    name = StringField('Nome do Cálculo', validators=[DataRequired()])
-    distributed_load = FloatField('Carga Distribuída (kN/m)', validators=[DataRequired(), NumberRange(min=0.1)])
-    length = FloatField('Vão (m)', validators=[DataRequired(), NumberRange(min=0.5)])
-    submit = SubmitField('Calcular')
+    name = StringField('Nome do Cálculo', validators=_V_REQ)
+    distributed_load = FloatField('Carga Distribuída (kN/m)', validators=(_REQ, NumberRange(min=0.1)))
+    length = FloatField('Vão (m)', validators=(_REQ, NumberRange(min=0.5)))
 
 # Hydrology Forms
 class ConcentrationTimeForm(FlaskForm):
-    name = StringField('Nome do Cálculo', validators=[DataRequired()])
-    length_km = FloatField('Comprimento do Fluxo (km)', validators=[DataRequired(), NumberRange(min=0.01)])
-    slope_percent = FloatField('Declividade (%)', validators=[DataRequired(), NumberRange(min=0.1, max=50)])
+    name = StringField('Nome do Cálculo', validators=_V_REQ)
+    length_km = FloatField('Comprimento do Fluxo (km)', validators=(_REQ, NumberRange(min=0.01)))
+    slope_percent = FloatField('Declividade (%)', validators=(_REQ, NumberRange(min=0.1, max=50)))
     method = SelectField('Método', choices=[
         ('kirpich', 'Kirpich'),
         ('nrcs', 'NRCS'),
         ('california', 'California Culverts')
     ])
-    submit = SubmitField('Calcular')
 
 class DetentionOutflowForm(FlaskForm):
-    name = StringField('Nome do Cálculo', validators=[DataRequired()])
-    inflow_rate = FloatField('Vazão de Entrada (m³/s)', validators=[DataRequired(), NumberRange(min=0.01)])
-    volume_change_rate = FloatField('Taxa de Variação do Volume (m³/s)', validators=[DataRequired()])
-    submit = SubmitField('Calcular')
+    name = StringField('Nome do Cálculo', validators=_V_REQ)
+    inflow_rate = FloatField('Vazão de Entrada (m³/s)', validators=(_REQ, NumberRange(min=0.01)))
+    volume_change_rate = FloatField('Taxa de Variação do Volume (m³/s)', validators=_V_REQ)
 
 # Steel Structures Forms
 class SteelTensionForm(FlaskForm):
-    name = StringField('Nome do Cálculo', validators=[DataRequired()])
-    force_kn = FloatField('Força (kN)', validators=[DataRequired()])
-    cross_area_cm2 = FloatField('Área da Seção (cm²)', validators=[DataRequired(), NumberRange(min=0.1)])
-    submit = SubmitField('Calcular')
+    name = StringField('Nome do Cálculo', validators=_V_REQ)
+    force_kn = FloatField('Força (kN)', validators=_V_REQ)
+    cross_area_cm2 = FloatField('Área da Seção (cm²)', validators=(_REQ, NumberRange(min=0.1)))
 
 class SteelBeamDeflectionForm(FlaskForm):
-    name = StringField('Nome do Cálculo', validators=[DataRequired()])
-    load_kn = FloatField('Carga Central (kN)', validators=[DataRequired(), NumberRange(min=0.1)])
-    length_m = FloatField('Vão (m)', validators=[DataRequired(), NumberRange(min=0.1)])
-    elastic_modulus = FloatField('Módulo de Elasticidade (MPa)', validators=[DataRequired(), NumberRange(min=100000)], default=200000)
-    moment_inertia_cm4 = FloatField('Momento de Inércia (cm⁴)', validators=[DataRequired(), NumberRange(min=1)])
-    submit = SubmitField('Calcular')
-
-# Industrial Construction Forms
-class PrecastElementForm(FlaskForm):
-    name = StringField('Nome do Cálculo', validators=[DataRequired()])
-    span_m = FloatField('Vão (m)', validators=[DataRequired(), NumberRange(min=1)])
-    distributed_load = FloatField('Carga Distribuída (kN/m)', validators=[DataRequired(), NumberRange(min=1)])
-    element_height_cm = FloatField('Altura do Elemento (cm)', validators=[DataRequired(), NumberRange(min=10)])
-    concrete_fck = FloatField('fck do Concreto (MPa)', validators=[DataRequired(), NumberRange(min=20, max=50)])
-    submit = SubmitField('Calcular')
-
-class RibbedSlabForm(FlaskForm):
-    name = StringField('Nome do Cálculo', validators=[DataRequired()])
-    rib_width_cm = FloatField('Largura da Nervura (cm)', validators=[DataRequired(), NumberRange(min=8, max=20)])
-    rib_height_cm = FloatField('Altura da Nervura (cm)', validators=[DataRequired(), NumberRange(min=15, max=50)])
-    flange_thickness_cm = FloatField('Espessura da Mesa (cm)', validators=[DataRequired(), NumberRange(min=4, max=10)])
-    rib_spacing_cm = FloatField('Espaçamento entre Nervuras (cm)', validators=[DataRequired(), NumberRange(min=40, max=100)])
-    submit = SubmitField('Calcular')
-
-# Building Installations Forms
-class VoltageDropForm(FlaskForm):
-    name = StringField('Nome do Cálculo', validators=[DataRequired()])
-    current_a = FloatField('Corrente (A)', validators=[DataRequired(), NumberRange(min=0.1)])
-    resistance_ohm_km = FloatField('Resistência (Ω/km)', validators=[DataRequired(), NumberRange(min=0.001)])
-    length_km = FloatField('Comprimento (km)', validators=[DataRequired(), NumberRange(min=0.001)])
-    submit = SubmitField('Calcular')
-
-class GasPipeLossForm(FlaskForm):
-    name = StringField('Nome do Cálculo', validators=[DataRequired()])
-    flow_rate_m3h = FloatField('Vazão (m³/h)', validators=[DataRequired(), NumberRange(min=0.1)])
-    pipe_diameter_mm = FloatField('Diâmetro da Tubulação (mm)', validators=[DataRequired(), NumberRange(min=10)])
-    length_m = FloatField('Comprimento (m)', validators=[DataRequired(), NumberRange(min=0.1)])
-    gas_density = FloatField('Densidade do Gás', validators=[Optional(), NumberRange(min=0.1, max=2)], default=0.8)
-    submit = SubmitField('Calcular')
+    name = StringField('Nome do Cálculo', validators=_V_REQ)
+    load_kn = FloatField('Carga Central (kN)', validators=(_REQ, NumberRange(min=0.1)))
+    length_m = FloatField('Vão (m)', validators=(_REQ, NumberRange(min=0.1)))
+    elastic_modulus = FloatField('Módulo de Elasticidade (MPa)', validators=(_REQ, NumberRange(min=100000)), default=200000)
+    moment_inertia_cm4 = FloatField('Momento de Inércia (cm⁴)', validators=(_REQ, NumberRange(min=1)))
 
 # Construction Control Forms
 class ProductivityForm(FlaskForm):
-    name = StringField('Nome do Cálculo', validators=[DataRequired()])
-    quantity_executed = FloatField('Quantidade Executada', validators=[DataRequired(), NumberRange(min=0.1)])
-    time_spent_hours = FloatField('Tempo Gasto (horas)', validators=[DataRequired(), NumberRange(min=0.1)])
-    unit = StringField('Unidade', validators=[DataRequired()], default='m²')
-    submit = SubmitField('Calcular')
+    name = StringField('Nome do Cálculo', validators=_V_REQ)
+    quantity_executed = FloatField('Quantidade Executada', validators=(_REQ, NumberRange(min=0.1)))
+    time_spent_hours = FloatField('Tempo Gasto (horas)', validators=(_REQ, NumberRange(min=0.1)))
+    unit = StringField('Unidade', validators=_V_REQ, default='m²')
 
 class SCurveForm(FlaskForm):
-    name = StringField('Nome do Cálculo', validators=[DataRequired()])
-    total_budget = FloatField('Orçamento Total (R$)', validators=[DataRequired(), NumberRange(min=1)])
-    current_time_percent = FloatField('Tempo Decorrido (%)', validators=[DataRequired(), NumberRange(min=0, max=100)])
+    name = StringField('Nome do Cálculo', validators=_V_REQ)
+    total_budget = FloatField('Orçamento Total (R$)', validators=(_REQ, NumberRange(min=1)))
+    current_time_percent = FloatField('Tempo Decorrido (%)', validators=(_REQ, NumberRange(min=0, max=100)))
     curve_type = SelectField('Tipo de Curva', choices=[
         ('normal', 'Normal (S padrão)'),
         ('fast_start', 'Início rápido'),
         ('slow_start', 'Início lento'),
         ('linear', 'Linear')
     ])
-    submit = SubmitField('Calcular')
 
 # Sustainability Forms
 class CarbonFootprintForm(FlaskForm):
-    name = StringField('Nome do Cálculo', validators=[DataRequired()])
-    material_mass_kg = FloatField('Massa do Material (kg)', validators=[DataRequired(), NumberRange(min=0.1)])
-    emission_factor_kg_co2_kg = FloatField('Fator de Emissão (kg CO₂/kg)', validators=[DataRequired(), NumberRange(min=0)])
+    name = StringField('Nome do Cálculo', validators=_V_REQ)
+    material_mass_kg = FloatField('Massa do Material (kg)', validators=(_REQ, NumberRange(min=0.1)))
+    emission_factor_kg_co2_kg = FloatField('Fator de Emissão (kg CO₂/kg)', validators=(_REQ, NumberRange(min=0)))
     material_type = SelectField('Tipo de Material', choices=[
         ('cement', 'Cimento'),
         ('steel', 'Aço'),
@@ -383,13 +452,12 @@ class CarbonFootprintForm(FlaskForm):
         ('wood', 'Madeira'),
         ('brick', 'Tijolo')
     ])
-    submit = SubmitField('Calcular')
 
 class ThermalLossForm(FlaskForm):
-    name = StringField('Nome do Cálculo', validators=[DataRequired()])
-    u_value = FloatField('Coeficiente U (W/m²·K)', validators=[DataRequired(), NumberRange(min=0.1, max=10)])
-    area_m2 = FloatField('Área (m²)', validators=[DataRequired(), NumberRange(min=0.1)])
-    temp_difference = FloatField('Diferença de Temperatura (K)', validators=[DataRequired(), NumberRange(min=1, max=50)])
+    name = StringField('Nome do Cálculo', validators=_V_REQ)
+    u_value = FloatField('Coeficiente U (W/m²·K)', validators=(_REQ, NumberRange(min=0.1, max=10)))
+    area_m2 = FloatField('Área (m²)', validators=(_REQ, NumberRange(min=0.1)))
+    temp_difference = FloatField('Diferença de Temperatura (K)', validators=(_REQ, NumberRange(min=1, max=50)))
     element_type = SelectField('Tipo de Elemento', choices=[
         ('wall_uninsulated', 'Parede sem isolamento'),
         ('wall_insulated', 'Parede com isolamento'),
@@ -399,214 +467,216 @@ class ThermalLossForm(FlaskForm):
         ('window_double', 'Janela dupla'),
         ('window_triple', 'Janela tripla')
     ])
-    submit = SubmitField('Calcular')
 
 
 # Advanced Structural Forms
 class LoadCombinationForm(FlaskForm):
-    name = StringField('Nome do Cálculo', validators=[DataRequired()])
-    dead_load = FloatField('Carga Permanente - D (kN)', validators=[DataRequired(), NumberRange(min=0)])
-    live_load = FloatField('Carga Variável - L (kN)', validators=[DataRequired(), NumberRange(min=0)])
-    wind_load = FloatField('Carga de Vento - W (kN)', validators=[DataRequired(), NumberRange(min=0)])
-    snow_load = FloatField('Sobrecarga - S (kN)', validators=[DataRequired(), NumberRange(min=0)])
-    alpha_d = FloatField('Fator αD', validators=[Optional(), NumberRange(min=0.5, max=3.0)], default=1.2)
-    alpha_l = FloatField('Fator αL', validators=[Optional(), NumberRange(min=0.5, max=3.0)], default=1.6)
-    alpha_w = FloatField('Fator αW', validators=[Optional(), NumberRange(min=0.5, max=3.0)], default=1.6)
-    alpha_s = FloatField('Fator αS', validators=[Optional(), NumberRange(min=0.5, max=3.0)], default=1.2)
-    submit = SubmitField('Calcular')
+    name = StringField('Nome do Cálculo', validators=_V_REQ)
+    dead_load = FloatField('Carga Permanente - D (kN)', validators=(_REQ, NumberRange(min=0)))
+    live_load = FloatField('Carga Variável - L (kN)', validators=(_REQ, NumberRange(min=0)))
+    wind_load = FloatField('Carga de Vento - W (kN)', validators=(_REQ, NumberRange(min=0)))
+    snow_load = FloatField('Sobrecarga - S (kN)', validators=(_REQ, NumberRange(min=0)))
+    alpha_d = FloatField('Fator αD', validators=(_OPT, NumberRange(min=0.5, max=3.0)), default=1.2)
+    alpha_l = FloatField('Fator αL', validators=(_OPT, NumberRange(min=0.5, max=3.0)), default=1.6)
+    alpha_w = FloatField('Fator αW', validators=(_OPT, NumberRange(min=0.5, max=3.0)), default=1.6)
+    alpha_s = FloatField('Fator αS', validators=(_OPT, NumberRange(min=0.5, max=3.0)), default=1.2)
 
 class ConcreteShearForm(FlaskForm):
-    name = StringField('Nome do Cálculo', validators=[DataRequired()])
-    asv = FloatField('Área da Armadura Transversal - Asv (mm²)', validators=[DataRequired(), NumberRange(min=1)])
-    fy = FloatField('Resistência do Aço - fy (MPa)', validators=[DataRequired(), NumberRange(min=250, max=600)])
-    d = FloatField('Altura Útil - d (mm)', validators=[DataRequired(), NumberRange(min=50)])
-    s = FloatField('Espaçamento - s (mm)', validators=[DataRequired(), NumberRange(min=50, max=400)])
-    submit = SubmitField('Calcular')
+    name = StringField('Nome do Cálculo', validators=_V_REQ)
+    asv = FloatField('Área da Armadura Transversal - Asv (mm²)', validators=(_REQ, NumberRange(min=1)))
+    fy = FloatField('Resistência do Aço - fy (MPa)', validators=(_REQ, NumberRange(min=250, max=600)))
+    d = FloatField('Altura Útil - d (mm)', validators=(_REQ, NumberRange(min=50)))
+    s = FloatField('Espaçamento - s (mm)', validators=(_REQ, NumberRange(min=50, max=400)))
 
 class PunchingShearForm(FlaskForm):
-    name = StringField('Nome do Cálculo', validators=[DataRequired()])
-    tau_rd = FloatField('Tensão Resistente - τRd,c (MPa)', validators=[DataRequired(), NumberRange(min=0.1, max=5.0)])
-    u1 = FloatField('Perímetro Crítico - u1 (mm)', validators=[DataRequired(), NumberRange(min=100)])
-    d = FloatField('Altura Útil - d (mm)', validators=[DataRequired(), NumberRange(min=50)])
-    submit = SubmitField('Calcular')
+    name = StringField('Nome do Cálculo', validators=_V_REQ)
+    tau_rd = FloatField('Tensão Resistente - τRd,c (MPa)', validators=(_REQ, NumberRange(min=0.1, max=5.0)))
+    u1 = FloatField('Perímetro Crítico - u1 (mm)', validators=(_REQ, NumberRange(min=100)))
+    d = FloatField('Altura Útil - d (mm)', validators=(_REQ, NumberRange(min=50)))
 
 class EulerBucklingForm(FlaskForm):
-    name = StringField('Nome do Cálculo', validators=[DataRequired()])
-    e_modulus = FloatField('Módulo de Elasticidade - E (MPa)', validators=[DataRequired(), NumberRange(min=100000)])
-    moment_inertia = FloatField('Momento de Inércia - I (mm⁴)', validators=[DataRequired(), NumberRange(min=1000)])
-    k_factor = FloatField('Fator K (Comprimento Efetivo)', validators=[DataRequired(), NumberRange(min=0.5, max=2.0)])
-    length = FloatField('Comprimento - L (mm)', validators=[DataRequired(), NumberRange(min=100)])
-    submit = SubmitField('Calcular')
+    name = StringField('Nome do Cálculo', validators=_V_REQ)
+    e_modulus = FloatField('Módulo de Elasticidade - E (MPa)', validators=(_REQ, NumberRange(min=100000)))
+    moment_inertia = FloatField('Momento de Inércia - I (mm⁴)', validators=(_REQ, NumberRange(min=1000)))
+    k_factor = FloatField('Fator K (Comprimento Efetivo)', validators=(_REQ, NumberRange(min=0.5, max=2.0)))
+    length = FloatField('Comprimento - L (mm)', validators=(_REQ, NumberRange(min=100)))
 
 class LateralTorsionalBucklingForm(FlaskForm):
-    name = StringField('Nome do Cálculo', validators=[DataRequired()])
-    c1 = FloatField('Fator de Modificação C1', validators=[DataRequired(), NumberRange(min=0.5, max=2.5)])
-    e_modulus = FloatField('Módulo de Elasticidade - E (MPa)', validators=[DataRequired(), NumberRange(min=100000)])
-    iz = FloatField('Momento de Inércia - Iz (mm⁴)', validators=[DataRequired(), NumberRange(min=1000)])
-    lb = FloatField('Comprimento Não Contraventado - Lb (mm)', validators=[DataRequired(), NumberRange(min=100)])
-    g_modulus = FloatField('Módulo de Cisalhamento - G (MPa)', validators=[DataRequired(), NumberRange(min=50000)])
-    j_constant = FloatField('Constante de Torção - J (mm⁴)', validators=[DataRequired(), NumberRange(min=100)])
-    iw = FloatField('Constante de Empenamento - Iw (mm⁶)', validators=[DataRequired(), NumberRange(min=1000000)])
-    submit = SubmitField('Calcular')
+    name = StringField('Nome do Cálculo', validators=_V_REQ)
+    c1 = FloatField('Fator de Modificação C1', validators=(_REQ, NumberRange(min=0.5, max=2.5)))
+    e_modulus = FloatField('Módulo de Elasticidade - E (MPa)', validators=(_REQ, NumberRange(min=100000)))
+    iz = FloatField('Momento de Inércia - Iz (mm⁴)', validators=(_REQ, NumberRange(min=1000)))
+    lb = FloatField('Comprimento Não Contraventado - Lb (mm)', validators=(_REQ, NumberRange(min=100)))
+    g_modulus = FloatField('Módulo de Cisalhamento - G (MPa)', validators=(_REQ, NumberRange(min=50000)))
+    j_constant = FloatField('Constante de Torção - J (mm⁴)', validators=(_REQ, NumberRange(min=100)))
+    iw = FloatField('Constante de Empenamento - Iw (mm⁶)', validators=(_REQ, NumberRange(min=1000000)))
 
 class WoodConnectionForm(FlaskForm):
-    name = StringField('Nome do Cálculo', validators=[DataRequired()])
-    embedment_strength = FloatField('Resistência ao Embutimento (kN)', validators=[DataRequired(), NumberRange(min=0.1)])
-    flexural_strength = FloatField('Resistência à Flexão do Conector (kN)', validators=[DataRequired(), NumberRange(min=0.1)])
-    withdrawal_strength = FloatField('Resistência ao Arrancamento (kN)', validators=[DataRequired(), NumberRange(min=0.1)])
+    name = StringField('Nome do Cálculo', validators=_V_REQ)
+    embedment_strength = FloatField('Resistência ao Embutimento (kN)', validators=(_REQ, NumberRange(min=0.1)))
+    flexural_strength = FloatField('Resistência à Flexão do Conector (kN)', validators=(_REQ, NumberRange(min=0.1)))
+    withdrawal_strength = FloatField('Resistência ao Arrancamento (kN)', validators=(_REQ, NumberRange(min=0.1)))
     connection_type = SelectField('Tipo de Conexão', choices=[
         ('nail', 'Prego'),
         ('bolt', 'Parafuso'),
         ('screw', 'Tirante/Parafuso Roscado')
     ])
-    submit = SubmitField('Calcular')
+
+# Industrial Construction Forms
+class PrecastElementForm(FlaskForm):
+    name = StringField('Nome do Cálculo', validators=_V_REQ)
+    span_m = FloatField('Vão (m)', validators=(_REQ, NumberRange(min=1)))
+    distributed_load = FloatField('Carga Distribuída (kN/m)', validators=(_REQ, NumberRange(min=1)))
+    element_height_cm = FloatField('Altura do Elemento (cm)', validators=(_REQ, NumberRange(min=10)))
+    concrete_fck = FloatField('fck do Concreto (MPa)', validators=(_REQ, NumberRange(min=20, max=50)))
+
+class RibbedSlabForm(FlaskForm):
+    name = StringField('Nome do Cálculo', validators=_V_REQ)
+    rib_width_cm = FloatField('Largura da Nervura (cm)', validators=(_REQ, NumberRange(min=8, max=20)))
+    rib_height_cm = FloatField('Altura da Nervura (cm)', validators=(_REQ, NumberRange(min=15, max=50)))
+    flange_thickness_cm = FloatField('Espessura da Mesa (cm)', validators=(_REQ, NumberRange(min=4, max=10)))
+    rib_spacing_cm = FloatField('Espaçamento entre Nervuras (cm)', validators=(_REQ, NumberRange(min=40, max=100)))
+
+# Building Installations Forms
+class VoltageDropForm(FlaskForm):
+    name = StringField('Nome do Cálculo', validators=_V_REQ)
+    current_a = FloatField('Corrente (A)', validators=(_REQ, NumberRange(min=0.1)))
+    resistance_ohm_km = FloatField('Resistência (Ω/km)', validators=(_REQ, NumberRange(min=0.001)))
+    length_km = FloatField('Comprimento (km)', validators=(_REQ, NumberRange(min=0.001)))
+
+class GasPipeLossForm(FlaskForm):
+    name = StringField('Nome do Cálculo', validators=_V_REQ)
+    flow_rate_m3h = FloatField('Vazão (m³/h)', validators=(_REQ, NumberRange(min=0.1)))
+    pipe_diameter_mm = FloatField('Diâmetro da Tubulação (mm)', validators=(_REQ, NumberRange(min=10)))
+    length_m = FloatField('Comprimento (m)', validators=(_REQ, NumberRange(min=0.1)))
+    gas_density = FloatField('Densidade do Gás', validators=(_OPT, NumberRange(min=0.1, max=2)), default=0.8)
 
 # Advanced Geotechnical Forms
 class EccentricFootingForm(FlaskForm):
-    name = StringField('Nome do Cálculo', validators=[DataRequired()])
-    normal_force = FloatField('Força Normal - N (kN)', validators=[DataRequired(), NumberRange(min=1)])
-    base_width = FloatField('Largura da Base - B (m)', validators=[DataRequired(), NumberRange(min=0.5)])
-    base_length = FloatField('Comprimento da Base - L (m)', validators=[DataRequired(), NumberRange(min=0.5)])
-    eccentricity = FloatField('Excentricidade - e (m)', validators=[DataRequired()])
-    submit = SubmitField('Calcular')
+    name = StringField('Nome do Cálculo', validators=_V_REQ)
+    normal_force = FloatField('Força Normal - N (kN)', validators=(_REQ, NumberRange(min=1)))
+    base_width = FloatField('Largura da Base - B (m)', validators=(_REQ, NumberRange(min=0.5)))
+    base_length = FloatField('Comprimento da Base - L (m)', validators=(_REQ, NumberRange(min=0.5)))
+    eccentricity = FloatField('Excentricidade - e (m)', validators=_V_REQ)
 
 class InfiniteSlopeForm(FlaskForm):
-    name = StringField('Nome do Cálculo', validators=[DataRequired()])
-    cohesion = FloatField('Coesão - c\' (kPa)', validators=[DataRequired(), NumberRange(min=0)])
-    unit_weight = FloatField('Peso Específico - γ (kN/m³)', validators=[DataRequired(), NumberRange(min=15, max=25)])
-    depth = FloatField('Profundidade - z (m)', validators=[DataRequired(), NumberRange(min=0.5)])
-    slope_angle = FloatField('Ângulo do Talude - θ (graus)', validators=[DataRequired(), NumberRange(min=5, max=60)])
-    friction_angle = FloatField('Ângulo de Atrito - φ\' (graus)', validators=[DataRequired(), NumberRange(min=0, max=45)])
-    pore_pressure = FloatField('Poropressão - u (kPa)', validators=[Optional(), NumberRange(min=0)], default=0)
-    submit = SubmitField('Calcular')
+    name = StringField('Nome do Cálculo', validators=_V_REQ)
+    cohesion = FloatField('Coesão - c\' (kPa)', validators=(_REQ, NumberRange(min=0)))
+    unit_weight = FloatField('Peso Específico - γ (kN/m³)', validators=(_REQ, NumberRange(min=15, max=25)))
+    depth = FloatField('Profundidade - z (m)', validators=(_REQ, NumberRange(min=0.5)))
+    slope_angle = FloatField('Ângulo do Talude - θ (graus)', validators=(_REQ, NumberRange(min=5, max=60)))
+    friction_angle = FloatField('Ângulo de Atrito - φ\' (graus)', validators=(_REQ, NumberRange(min=0, max=45)))
+    pore_pressure = FloatField('Poropressão - u (kPa)', validators=(_OPT, NumberRange(min=0)), default=0)
 
 class ElasticSettlementForm(FlaskForm):
-    name = StringField('Nome do Cálculo', validators=[DataRequired()])
-    q_load = FloatField('Pressão de Contato - q (kPa)', validators=[DataRequired(), NumberRange(min=10)])
-    width = FloatField('Largura da Fundação - B (m)', validators=[DataRequired(), NumberRange(min=0.5)])
-    elastic_modulus = FloatField('Módulo de Elasticidade - E (kPa)', validators=[DataRequired(), NumberRange(min=1000)])
-    poisson_ratio = FloatField('Coeficiente de Poisson - ν', validators=[DataRequired(), NumberRange(min=0.1, max=0.49)])
-    influence_factor = FloatField('Fator de Influência - Is', validators=[Optional(), NumberRange(min=0.1, max=2.0)], default=1.0)
-    submit = SubmitField('Calcular')
+    name = StringField('Nome do Cálculo', validators=_V_REQ)
+    q_load = FloatField('Pressão de Contato - q (kPa)', validators=(_REQ, NumberRange(min=10)))
+    width = FloatField('Largura da Fundação - B (m)', validators=(_REQ, NumberRange(min=0.5)))
+    elastic_modulus = FloatField('Módulo de Elasticidade - E (kPa)', validators=(_REQ, NumberRange(min=1000)))
+    poisson_ratio = FloatField('Coeficiente de Poisson - ν', validators=(_REQ, NumberRange(min=0.1, max=0.49)))
+    influence_factor = FloatField('Fator de Influência - Is', validators=(_OPT, NumberRange(min=0.1, max=2.0)), default=1.0)
 
 class PileCapacityForm(FlaskForm):
-    name = StringField('Nome do Cálculo', validators=[DataRequired()])
-    qp = FloatField('Resistência de Ponta - qp (kPa)', validators=[DataRequired(), NumberRange(min=100)])
-    ap = FloatField('Área da Ponta - Ap (m²)', validators=[DataRequired(), NumberRange(min=0.01)])
-    fs_values = StringField('Atritos Laterais - fs (kPa, separado por vírgula)', validators=[DataRequired()])
-    as_values = StringField('Áreas Laterais - As (m², separado por vírgula)', validators=[DataRequired()])
-    safety_factor = FloatField('Fator de Segurança', validators=[Optional(), NumberRange(min=1.5, max=5.0)], default=2.5)
-    submit = SubmitField('Calcular')
+    name = StringField('Nome do Cálculo', validators=_V_REQ)
+    qp = FloatField('Resistência de Ponta - qp (kPa)', validators=(_REQ, NumberRange(min=100)))
+    ap = FloatField('Área da Ponta - Ap (m²)', validators=(_REQ, NumberRange(min=0.01)))
+    fs_values = FloatListField('Atritos Laterais - fs (kPa, separado por vírgula)', validators=_V_REQ)
+    as_values = FloatListField('Áreas Laterais - As (m², separado por vírgula)', validators=_V_REQ)
+    safety_factor = FloatField('Fator de Segurança', validators=(_OPT, NumberRange(min=1.5, max=5.0)), default=2.5)
 
 # Advanced Hydrology Forms
 class SCSRunoffForm(FlaskForm):
-    name = StringField('Nome do Cálculo', validators=[DataRequired()])
-    precipitation = FloatField('Precipitação - P (mm)', validators=[DataRequired(), NumberRange(min=0.1)])
-    curve_number = IntegerField('Curve Number - CN', validators=[DataRequired(), NumberRange(min=30, max=100)])
-    submit = SubmitField('Calcular')
+    name = StringField('Nome do Cálculo', validators=_V_REQ)
+    precipitation = FloatField('Precipitação - P (mm)', validators=(_REQ, NumberRange(min=0.1)))
+    curve_number = IntegerField('Curve Number - CN', validators=(_REQ, NumberRange(min=30, max=100)))
 
 class KirpichTimeForm(FlaskForm):
-    name = StringField('Nome do Cálculo', validators=[DataRequired()])
-    length_km = FloatField('Comprimento do Talvegue - L (km)', validators=[DataRequired(), NumberRange(min=0.1)])
-    slope_percent = FloatField('Declividade - S (%)', validators=[DataRequired(), NumberRange(min=0.1, max=50)])
-    submit = SubmitField('Calcular')
+    name = StringField('Nome do Cálculo', validators=_V_REQ)
+    length_km = FloatField('Comprimento do Talvegue - L (km)', validators=(_REQ, NumberRange(min=0.1)))
+    slope_percent = FloatField('Declividade - S (%)', validators=(_REQ, NumberRange(min=0.1, max=50)))
 
 class ChannelEnergyForm(FlaskForm):
-    name = StringField('Nome do Cálculo', validators=[DataRequired()])
-    depth = FloatField('Profundidade - y (m)', validators=[DataRequired(), NumberRange(min=0.01)])
-    velocity = FloatField('Velocidade - v (m/s)', validators=[DataRequired(), NumberRange(min=0.1)])
-    submit = SubmitField('Calcular')
+    name = StringField('Nome do Cálculo', validators=_V_REQ)
+    depth = FloatField('Profundidade - y (m)', validators=(_REQ, NumberRange(min=0.01)))
+    velocity = FloatField('Velocidade - v (m/s)', validators=(_REQ, NumberRange(min=0.1)))
 
 class WaterHammerForm(FlaskForm):
-    name = StringField('Nome do Cálculo', validators=[DataRequired()])
-    density = FloatField('Densidade da Água - ρ (kg/m³)', validators=[Optional(), NumberRange(min=900, max=1100)], default=1000)
-    wave_velocity = FloatField('Velocidade da Onda - a (m/s)', validators=[DataRequired(), NumberRange(min=800, max=1500)])
-    velocity_change = FloatField('Variação de Velocidade - ΔV (m/s)', validators=[DataRequired(), NumberRange(min=0.1)])
-    submit = SubmitField('Calcular')
+    name = StringField('Nome do Cálculo', validators=_V_REQ)
+    density = FloatField('Densidade da Água - ρ (kg/m³)', validators=(_OPT, NumberRange(min=900, max=1100)), default=1000)
+    wave_velocity = FloatField('Velocidade da Onda - a (m/s)', validators=(_REQ, NumberRange(min=800, max=1500)))
+    velocity_change = FloatField('Variação de Velocidade - ΔV (m/s)', validators=(_REQ, NumberRange(min=0.1)))
 
 class PumpSimilarityForm(FlaskForm):
-    name = StringField('Nome do Cálculo', validators=[DataRequired()])
-    n1 = FloatField('Rotação Inicial - N1 (rpm)', validators=[DataRequired(), NumberRange(min=100)])
-    q1 = FloatField('Vazão Inicial - Q1 (L/s)', validators=[DataRequired(), NumberRange(min=1)])
-    h1 = FloatField('Altura Manométrica Inicial - H1 (m)', validators=[DataRequired(), NumberRange(min=1)])
-    p1 = FloatField('Potência Inicial - P1 (kW)', validators=[DataRequired(), NumberRange(min=0.1)])
-    n2 = FloatField('Nova Rotação - N2 (rpm)', validators=[DataRequired(), NumberRange(min=100)])
-    submit = SubmitField('Calcular')
+    name = StringField('Nome do Cálculo', validators=_V_REQ)
+    n1 = FloatField('Rotação Inicial - N1 (rpm)', validators=(_REQ, NumberRange(min=100)))
+    q1 = FloatField('Vazão Inicial - Q1 (L/s)', validators=(_REQ, NumberRange(min=1)))
+    h1 = FloatField('Altura Manométrica Inicial - H1 (m)', validators=(_REQ, NumberRange(min=1)))
+    p1 = FloatField('Potência Inicial - P1 (kW)', validators=(_REQ, NumberRange(min=0.1)))
+    n2 = FloatField('Nova Rotação - N2 (rpm)', validators=(_REQ, NumberRange(min=100)))
 
 # Advanced Pavement Forms
 class ESALForm(FlaskForm):
-    name = StringField('Nome do Cálculo', validators=[DataRequired()])
-    axle_loads = StringField('Número de Eixos por Tipo (separado por vírgula)', validators=[DataRequired()])
-    equivalence_factors = StringField('Fatores de Equivalência (separado por vírgula)', validators=[DataRequired()])
-    submit = SubmitField('Calcular')
+    name = StringField('Nome do Cálculo', validators=_V_REQ)
+    axle_loads = FloatListField('Número de Eixos por Tipo (separado por vírgula)', validators=_V_REQ)
+    equivalence_factors = FloatListField('Fatores de Equivalência (separado por vírgula)', validators=_V_REQ)
 
 class TrafficGrowthForm(FlaskForm):
-    name = StringField('Nome do Cálculo', validators=[DataRequired()])
-    adt0 = FloatField('Tráfego Inicial - ADT0 (veículos/dia)', validators=[DataRequired(), NumberRange(min=10)])
-    growth_rate_pct = FloatField('Taxa de Crescimento - r (%/ano)', validators=[DataRequired(), NumberRange(min=0, max=20)])
-    period_years = IntegerField('Período - n (anos)', validators=[DataRequired(), NumberRange(min=1, max=30)])
-    lane_factor = FloatField('Fator de Faixa - LF', validators=[Optional(), NumberRange(min=0.3, max=1.0)], default=1.0)
-    directional_factor = FloatField('Fator Direcional - DL', validators=[Optional(), NumberRange(min=0.3, max=0.7)], default=0.5)
-    submit = SubmitField('Calcular')
+    name = StringField('Nome do Cálculo', validators=_V_REQ)
+    adt0 = FloatField('Tráfego Inicial - ADT0 (veículos/dia)', validators=(_REQ, NumberRange(min=10)))
+    growth_rate_pct = FloatField('Taxa de Crescimento - r (%/ano)', validators=(_REQ, NumberRange(min=0, max=20)))
+    period_years = IntegerField('Período - n (anos)', validators=(_REQ, NumberRange(min=1, max=30)))
+    lane_factor = FloatField('Fator de Faixa - LF', validators=(_OPT, NumberRange(min=0.3, max=1.0)), default=1.0)
+    directional_factor = FloatField('Fator Direcional - DL', validators=(_OPT, NumberRange(min=0.3, max=0.7)), default=0.5)
 
 class StoppingDistanceForm(FlaskForm):
-    name = StringField('Nome do Cálculo', validators=[DataRequired()])
-    speed_kmh = FloatField('Velocidade - v (km/h)', validators=[DataRequired(), NumberRange(min=20, max=150)])
-    reaction_time_s = FloatField('Tempo de Reação - tr (s)', validators=[Optional(), NumberRange(min=0.5, max=3.0)], default=2.5)
-    friction_coeff = FloatField('Coeficiente de Atrito - f', validators=[DataRequired(), NumberRange(min=0.1, max=0.8)])
-    grade_pct = FloatField('Rampa - G (% - positivo subida)', validators=[Optional(), NumberRange(min=-15, max=15)], default=0)
-    submit = SubmitField('Calcular')
+    name = StringField('Nome do Cálculo', validators=_V_REQ)
+    speed_kmh = FloatField('Velocidade - v (km/h)', validators=(_REQ, NumberRange(min=20, max=150)))
+    reaction_time_s = FloatField('Tempo de Reação - tr (s)', validators=(_OPT, NumberRange(min=0.5, max=3.0)), default=2.5)
+    friction_coeff = FloatField('Coeficiente de Atrito - f', validators=(_REQ, NumberRange(min=0.1, max=0.8)))
+    grade_pct = FloatField('Rampa - G (% - positivo subida)', validators=(_OPT, NumberRange(min=-15, max=15)), default=0)
 
 # Building Systems Forms
 class LightingDesignForm(FlaskForm):
-    name = StringField('Nome do Cálculo', validators=[DataRequired()])
-    illuminance_target = FloatField('Iluminância Requerida - E (lux)', validators=[DataRequired(), NumberRange(min=50, max=2000)])
-    area_m2 = FloatField('Área - A (m²)', validators=[DataRequired(), NumberRange(min=1)])
-    lamp_lumens = FloatField('Lúmens por Lâmpada - Φlamp (lm)', validators=[DataRequired(), NumberRange(min=500)])
-    utilization_factor = FloatField('Fator de Utilização - UF', validators=[Optional(), NumberRange(min=0.3, max=0.8)], default=0.6)
-    maintenance_factor = FloatField('Fator de Manutenção - MF', validators=[Optional(), NumberRange(min=0.6, max=1.0)], default=0.8)
-    submit = SubmitField('Calcular')
+    name = StringField('Nome do Cálculo', validators=_V_REQ)
+    illuminance_target = FloatField('Iluminância Requerida - E (lux)', validators=(_REQ, NumberRange(min=50, max=2000)))
+    area_m2 = FloatField('Área - A (m²)', validators=(_REQ, NumberRange(min=1)))
+    lamp_lumens = FloatField('Lúmens por Lâmpada - Φlamp (lm)', validators=(_REQ, NumberRange(min=500)))
+    utilization_factor = FloatField('Fator de Utilização - UF', validators=(_OPT, NumberRange(min=0.3, max=0.8)), default=0.6)
+    maintenance_factor = FloatField('Fator de Manutenção - MF', validators=(_OPT, NumberRange(min=0.6, max=1.0)), default=0.8)
 
 class ThermalTransmissionForm(FlaskForm):
-    name = StringField('Nome do Cálculo', validators=[DataRequired()])
-    u_value = FloatField('Coeficiente U (W/m²·K)', validators=[DataRequired(), NumberRange(min=0.1, max=10)])
-    area_m2 = FloatField('Área - A (m²)', validators=[DataRequired(), NumberRange(min=0.1)])
-    temp_difference_k = FloatField('Diferença de Temperatura - ΔT (K)', validators=[DataRequired(), NumberRange(min=1, max=50)])
-    submit = SubmitField('Calcular')
+    name = StringField('Nome do Cálculo', validators=_V_REQ)
+    u_value = FloatField('Coeficiente U (W/m²·K)', validators=(_REQ, NumberRange(min=0.1, max=10)))
+    area_m2 = FloatField('Área - A (m²)', validators=(_REQ, NumberRange(min=0.1)))
+    temp_difference_k = FloatField('Diferença de Temperatura - ΔT (K)', validators=(_REQ, NumberRange(min=1, max=50)))
 
 class ReverberationForm(FlaskForm):
-    name = StringField('Nome do Cálculo', validators=[DataRequired()])
-    volume_m3 = FloatField('Volume - V (m³)', validators=[DataRequired(), NumberRange(min=10)])
-    absorption_coefficients = StringField('Coeficientes de Absorção α (separado por vírgula)', validators=[DataRequired()])
-    surface_areas = StringField('Áreas das Superfícies S (m², separado por vírgula)', validators=[DataRequired()])
-    submit = SubmitField('Calcular')
+    name = StringField('Nome do Cálculo', validators=_V_REQ)
+    volume_m3 = FloatField('Volume - V (m³)', validators=(_REQ, NumberRange(min=10)))
+    absorption_coefficients = FloatListField('Coeficientes de Absorção α (separado por vírgula)', validators=_V_REQ)
+    surface_areas = FloatListField('Áreas das Superfícies S (m², separado por vírgula)', validators=_V_REQ)
 
 class GutterSizingForm(FlaskForm):
-    name = StringField('Nome do Cálculo', validators=[DataRequired()])
-    rainfall_intensity = FloatField('Intensidade de Chuva - i (L/s·m²)', validators=[DataRequired(), NumberRange(min=0.001, max=0.01)])
-    catchment_area = FloatField('Área de Captação - A (m²)', validators=[DataRequired(), NumberRange(min=10)])
-    velocity_factor = FloatField('Fator de Velocidade', validators=[Optional(), NumberRange(min=0.5, max=1.5)], default=1.0)
-    submit = SubmitField('Calcular')
+    name = StringField('Nome do Cálculo', validators=_V_REQ)
+    rainfall_intensity = FloatField('Intensidade de Chuva - i (L/s·m²)', validators=(_REQ, NumberRange(min=0.001, max=0.01)))
+    catchment_area = FloatField('Área de Captação - A (m²)', validators=(_REQ, NumberRange(min=10)))
+    velocity_factor = FloatField('Fator de Velocidade', validators=(_OPT, NumberRange(min=0.5, max=1.5)), default=1.0)
 
 class StairBlondelForm(FlaskForm):
-    name = StringField('Nome do Cálculo', validators=[DataRequired()])
-    riser_height_cm = FloatField('Altura do Degrau - h (cm)', validators=[DataRequired(), NumberRange(min=15, max=20)])
-    tread_depth_cm = FloatField('Profundidade do Degrau - b (cm)', validators=[DataRequired(), NumberRange(min=25, max=35)])
-    submit = SubmitField('Calcular')
+    name = StringField('Nome do Cálculo', validators=_V_REQ)
+    riser_height_cm = FloatField('Altura do Degrau - h (cm)', validators=(_REQ, NumberRange(min=15, max=20)))
+    tread_depth_cm = FloatField('Profundidade do Degrau - b (cm)', validators=(_REQ, NumberRange(min=25, max=35)))
 
 class PrismoidalVolumeForm(FlaskForm):
-    name = StringField('Nome do Cálculo', validators=[DataRequired()])
-    area1 = FloatField('Área Inicial - A1 (m²)', validators=[DataRequired(), NumberRange(min=0)])
-    area_middle = FloatField('Área do Meio - Am (m²)', validators=[DataRequired(), NumberRange(min=0)])
-    area2 = FloatField('Área Final - A2 (m²)', validators=[DataRequired(), NumberRange(min=0)])
-    length = FloatField('Comprimento - L (m)', validators=[DataRequired(), NumberRange(min=0.1)])
-    submit = SubmitField('Calcular')
+    name = StringField('Nome do Cálculo', validators=_V_REQ)
+    area1 = FloatField('Área Inicial - A1 (m²)', validators=(_REQ, NumberRange(min=0)))
+    area_middle = FloatField('Área do Meio - Am (m²)', validators=(_REQ, NumberRange(min=0)))
+    area2 = FloatField('Área Final - A2 (m²)', validators=(_REQ, NumberRange(min=0)))
+    length = FloatField('Comprimento - L (m)', validators=(_REQ, NumberRange(min=0.1)))
 
 # Economic Forms
 class NPVForm(FlaskForm):
-    name = StringField('Nome do Cálculo', validators=[DataRequired()])
-    cash_flows = StringField('Fluxos de Caixa (separado por vírgula)', validators=[DataRequired()], 
-                            render_kw={"placeholder": "Ex: 1000,1200,1500,800"})
-    discount_rate_pct = FloatField('Taxa de Desconto - i (%)', validators=[DataRequired(), NumberRange(min=0, max=50)])
-    initial_investment = FloatField('Investimento Inicial (R$)', validators=[DataRequired(), NumberRange(min=0)])
-    submit = SubmitField('Calcular')
+    name = StringField('Nome do Cálculo', validators=_V_REQ)
+    cash_flows = FloatListField('Fluxos de Caixa (separado por vírgula)', validators=_V_REQ, render_kw={"placeholder": "Ex: 1000,1200,1500,800"})
+    discount_rate_pct = FloatField('Taxa de Desconto - i (%)', validators=(_REQ, NumberRange(min=0, max=50)))
+    initial_investment = FloatField('Investimento Inicial (R$)', validators=(_REQ, NumberRange(min=0)))
@@ -1,8 +1,27 @@
 from datetime import datetime, timedelta
-from flask_login import UserMixin
+from operator import attrgetter
+from flask_login import AnonymousUserMixin, UserMixin
+from sqlalchemy import event, func, inspect
 from werkzeug.security import generate_password_hash, check_password_hash
 from app import db
 
+# Bits de permissão do usuário (User.role_flags)
+ADMIN = 1
+ENGINEER = 2
+CAN_CREATE = 4
+CAN_CALC = 8
+ACTIVE = 16
+
+_ROLE_FLAGS = {
+    'admin': ADMIN | ENGINEER | CAN_CREATE | CAN_CALC,
+    'engineer': ENGINEER | CAN_CREATE | CAN_CALC,
+}
+
+_role_and_status = attrgetter('role', 'is_active')
+
+# Módulos liberados no plano gratuito
+FREE_MODULES = frozenset(('structural_basic', 'hydraulics_basic'))
+
 class User(UserMixin, db.Model):
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(100), nullable=False)
@@ -33,23 +52,29 @@ class User(UserMixin, db.Model):
     
     def has_access_to_module(self, module):
         """Check if user has access to a specific module based on their plan"""
-        free_modules = ['structural_basic', 'hydraulics_basic']
-        
-        # Durante o período de trial, usuário tem acesso completo
-        if self.is_in_trial():
-            return True
-        
-        # Se o plano é free, só módulos básicos
-        if self.plan == 'free':
-            return module in free_modules
-        
-        # Se o plano é pro e não expirou, acesso completo
-        elif self.plan == 'pro':
-            if self.plan_expires and self.plan_expires > datetime.utcnow():
-                return True
-        
-        # Caso contrário, só módulos básicos
-        return module in free_modules
+        # Módulos básicos são liberados em qualquer plano; os demais exigem
+        # trial ou plano pro em vigor
+        return module in FREE_MODULES or self._plan_type(datetime.utcnow()) != 'free'
+    
+    def _plan_type(self, now):
+        """Plan in effect at `now`: 'trial', 'pro' or 'free'"""
+        plan = self.plan
+        if plan == 'trial' and self.trial_expires and now < self.trial_expires:
+            return 'trial'
+        if plan == 'pro' and self.plan_expires and self.plan_expires > now:
+            return 'pro'
+        return 'free'
+    
+    @property
+    def role_flags(self):
+        """Permission bits for the user's role and account status"""
+        role, is_active = _role_and_status(self)
+        return _ROLE_FLAGS.get(role, 0) | (ACTIVE if is_active else 0)
+    
+    @property
+    def role_bits(self):
+        """Permission bits granted by the role alone, whatever the status"""
+        return _ROLE_FLAGS.get(self.role, 0)
     
     def is_admin(self):
         """Check if user is an administrator"""
@@ -57,7 +82,7 @@ class User(UserMixin, db.Model):
     
     def is_engineer(self):
         """Check if user is an engineer"""
-        return self.role in ['admin', 'engineer']
+        return bool(self.role_bits & ENGINEER)
     
     def is_client(self):
         """Check if user is a client"""
@@ -69,15 +94,15 @@ class User(UserMixin, db.Model):
     
     def can_create_projects(self):
         """Check if user can create projects"""
-        return self.role in ['admin', 'engineer']
+        return bool(self.role_bits & CAN_CREATE)
     
     def can_perform_calculations(self):
         """Check if user can perform engineering calculations"""
-        return self.role in ['admin', 'engineer']
+        return bool(self.role_bits & CAN_CALC)
     
     def can_access_reports(self):
         """Check if user can access detailed reports"""
-        return self.role in ['admin', 'engineer']
+        return bool(self.role_bits & ENGINEER)
     
     def is_in_trial(self):
         """Check if user is currently in trial period"""
@@ -111,21 +136,21 @@ class User(UserMixin, db.Model):
     
     def get_plan_status(self):
         """Get current plan status for display"""
-        if self.is_in_trial():
-            days_remaining = self.get_trial_days_remaining()
+        now = datetime.utcnow()
+        plan_type = self._plan_type(now)
+        if plan_type == 'trial':
             return {
                 'type': 'trial',
                 'name': 'Teste Grátis',
-                'days_remaining': days_remaining,
+                'days_remaining': max(0, (self.trial_expires - now).days),
                 'expires': self.trial_expires,
                 'has_full_access': True
             }
-        elif self.plan == 'pro' and self.plan_expires and self.plan_expires > datetime.utcnow():
-            remaining = self.plan_expires - datetime.utcnow()
+        elif plan_type == 'pro':
             return {
                 'type': 'pro',
                 'name': 'Profissional',
-                'days_remaining': remaining.days,
+                'days_remaining': (self.plan_expires - now).days,
                 'expires': self.plan_expires,
                 'has_full_access': True
             }
@@ -149,6 +174,26 @@ class User(UserMixin, db.Model):
             return project.client_email == self.email
         return False
 
+class AnonymousUser(AnonymousUserMixin):
+    """Visitor that is not logged in; every role check fails"""
+    
+    role_flags = 0
+    
+    def is_admin(self):
+        return False
+    
+    def is_engineer(self):
+        return False
+    
+    def is_client(self):
+        return False
+    
+    def can_create_projects(self):
+        return False
+    
+    def can_perform_calculations(self):
+        return False
+
 class Payment(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
@@ -168,6 +213,12 @@ class Calculation(db.Model):
     inputs = db.Column(db.Text, nullable=False)  # JSON string
     results = db.Column(db.Text, nullable=False)  # JSON string
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    
+    # Histórico e dashboard listam por usuário, do mais recente
+    __table_args__ = (
+        db.Index('ix_calculation_user_created', 'user_id', 'created_at'),
+        db.Index('ix_calculation_project_id', 'project_id'),
+    )
 
 class Project(db.Model):
     id = db.Column(db.Integer, primary_key=True)
@@ -187,6 +238,10 @@ class Project(db.Model):
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
+    __table_args__ = (
+        db.Index('ix_project_user_created', 'user_id', 'created_at'),
+    )
+    
     # Relationships
     calculations = db.relationship('Calculation', backref='project', lazy=True)
     budgets = db.relationship('Budget', backref='project', lazy=True)
@@ -208,21 +263,58 @@ class Budget(db.Model):
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     created_by = db.Column(db.String(200))
     
+    __table_args__ = (
+        db.Index('ix_budget_project_created', 'project_id', 'created_at'),
+    )
+    
     # Relationships
     items = db.relationship('BudgetItem', backref='budget', lazy=True, cascade='all, delete-orphan')
 
 class BudgetItem(db.Model):
     id = db.Column(db.Integer, primary_key=True)
-    budget_id = db.Column(db.Integer, db.ForeignKey('budget.id'), nullable=False)
+    # active_history guarda o valor anterior destas colunas, usado pelos
+    # listeners do total do orçamento, mesmo após um commit expirar a linha
+    budget_id = db.column_property(db.Column(db.Integer, db.ForeignKey('budget.id'), nullable=False, index=True),
+                                   active_history=True)
     composition_id = db.Column(db.Integer, db.ForeignKey('cost_composition.id'), nullable=True)
     description = db.Column(db.String(500), nullable=False)
     unit = db.Column(db.String(10), nullable=False)  # m², m³, kg, un, etc.
     quantity = db.Column(db.Float, nullable=False)
     unit_cost = db.Column(db.Float, nullable=False)
-    total_cost = db.Column(db.Float, nullable=False)
+    total_cost = db.column_property(db.Column(db.Float, nullable=False), active_history=True)
     category = db.Column(db.String(100))  # estrutura, acabamento, instalacoes, etc.
     notes = db.Column(db.Text)
 
+# Budget.total_cost acompanha os itens por diferença, com um UPDATE por item
+# gravado, sem recarregar e somar todos os itens do orçamento
+def _add_to_budget_total(connection, budget_id, delta):
+    if budget_id is not None and delta:
+        budget = Budget.__table__
+        connection.execute(budget.update().where(budget.c.id == budget_id)
+                           .values(total_cost=func.coalesce(budget.c.total_cost, 0) + delta))
+
+@event.listens_for(BudgetItem, 'after_insert')
+def _budget_item_inserted(mapper, connection, target):
+    _add_to_budget_total(connection, target.budget_id, target.total_cost)
+
+@event.listens_for(BudgetItem, 'after_delete')
+def _budget_item_deleted(mapper, connection, target):
+    _add_to_budget_total(connection, target.budget_id, -(target.total_cost or 0))
+
+@event.listens_for(BudgetItem, 'after_update')
+def _budget_item_updated(mapper, connection, target):
+    attrs = inspect(target).attrs
+    cost, budget_id = attrs.total_cost.history, attrs.budget_id.history
+    if not (cost.has_changes() or budget_id.has_changes()):
+        return
+    old_cost = cost.deleted[0] if cost.deleted else target.total_cost
+    old_budget = budget_id.deleted[0] if budget_id.deleted else target.budget_id
+    if old_budget == target.budget_id:
+        _add_to_budget_total(connection, target.budget_id, (target.total_cost or 0) - (old_cost or 0))
+    else:
+        _add_to_budget_total(connection, old_budget, -(old_cost or 0))
+        _add_to_budget_total(connection, target.budget_id, target.total_cost)
+
 class CostComposition(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     sinapi_code = db.Column(db.String(20), unique=True)
@@ -270,12 +362,16 @@ class ProjectSchedule(db.Model):
     critical_path = db.Column(db.Text)  # JSON string
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     
+    __table_args__ = (
+        db.Index('ix_project_schedule_project_created', 'project_id', 'created_at'),
+    )
+    
     # Relationships
     activities = db.relationship('ScheduleActivity', backref='schedule', lazy=True, cascade='all, delete-orphan')
 
 class ScheduleActivity(db.Model):
     id = db.Column(db.Integer, primary_key=True)
-    schedule_id = db.Column(db.Integer, db.ForeignKey('project_schedule.id'), nullable=False)
+    schedule_id = db.Column(db.Integer, db.ForeignKey('project_schedule.id'), nullable=False, index=True)
     name = db.Column(db.String(200), nullable=False)
     description = db.Column(db.Text)
     duration = db.Column(db.Integer, nullable=False)  # dias
@@ -1,4 +1,3 @@
-import json
 from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional
 from io import BytesIO
@@ -7,11 +6,12 @@ from reportlab.lib import colors
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import mm
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
-from reportlab.pdfgen import canvas
 
 class BudgetCalculator:
     """Calculadora para orçamentos de obra com composições SINAPI/TCPO"""
     
+    __slots__ = ()
+    
     # Composições básicas pré-definidas (SINAPI simplificado)
     DEFAULT_COMPOSITIONS = {
         'concreto_fck25': {
@@ -128,6 +128,8 @@ class BudgetCalculator:
 class ScheduleCalculator:
     """Calculadora de cronogramas usando CPM (Critical Path Method)"""
     
+    __slots__ = ('activities',)
+    
     def __init__(self):
         self.activities = []
     
@@ -273,6 +275,8 @@ class ProductivityCalculator:
 class ReportGenerator:
     """Gerador de relatórios em PDF"""
     
+    __slots__ = ()
+    
     @staticmethod
     def generate_budget_report(project_data: Dict[str, Any], budget_data: Dict[str, Any]) -> Dict[str, Any]:
         """Gera relatório de orçamento (retorna estrutura de dados)"""
@@ -2,7 +2,7 @@ import json
 from datetime import datetime, date
 from flask import render_template, request, redirect, url_for, flash, session, jsonify
 from flask_login import login_user, logout_user, login_required, current_user
-from werkzeug.security import check_password_hash
+from sqlalchemy.orm import selectinload
 from app import app, db
 from models import (User, Calculation, Project, Budget, BudgetItem, 
                    CostComposition, Material, ProjectSchedule, ScheduleActivity)
@@ -14,15 +14,10 @@ from forms import (LoginForm, RegisterForm, BeamCalculationForm, ConcreteBeamFor
                    SteelConsumptionForm, MortarForm, BrickConsumptionForm, WallLoadForm,
                    RationalMethodForm, ManningForm, DarcyWeisbachForm, TorsionShearForm,
                    EulerBucklingForm, ContinuousBeamForm, ConcentrationTimeForm, DetentionOutflowForm,
-                   SteelTensionForm, SteelBeamDeflectionForm, PrecastElementForm, RibbedSlabForm,
-                   VoltageDropForm, GasPipeLossForm, ProductivityForm, SCurveForm,
+                   SteelTensionForm, SteelBeamDeflectionForm, ProductivityForm, SCurveForm,
                    CarbonFootprintForm, ThermalLossForm,
                    LoadCombinationForm, ConcreteShearForm, PunchingShearForm, LateralTorsionalBucklingForm,
-                   WoodConnectionForm, EccentricFootingForm, InfiniteSlopeForm, ElasticSettlementForm,
-                   PileCapacityForm, SCSRunoffForm, KirpichTimeForm, ChannelEnergyForm, WaterHammerForm,
-                   PumpSimilarityForm, ESALForm, TrafficGrowthForm, StoppingDistanceForm, LightingDesignForm,
-                   ThermalTransmissionForm, ReverberationForm, GutterSizingForm, StairBlondelForm,
-                   PrismoidalVolumeForm, NPVForm)
+                   WoodConnectionForm)
 from auth_decorators import (admin_required, engineer_required, can_create_projects_required,
                            can_perform_calculations_required, active_user_required)
 from calculations import (StructuralCalculations, ConcreteCalculations, 
@@ -109,8 +104,9 @@ def dashboard():
                                          .limit(5).all()
     
     # Estatísticas de projetos
-    total_projects = Project.query.filter_by(user_id=current_user.id).count()
-    projects = Project.query.filter_by(user_id=current_user.id).all()
+    projects = Project.query.filter_by(user_id=current_user.id)\
+                            .options(selectinload(Project.budgets)).all()
+    total_projects = len(projects)
     
     # Status do plano do usuário
     plan_status = current_user.get_plan_status()
@@ -127,7 +123,7 @@ def dashboard():
         elif project.status == 'concluido':
             completed_projects += 1
             
-        budgets = Budget.query.filter_by(project_id=project.id).all()
+        budgets = project.budgets
         total_budgets += len(budgets)
         
         for budget in budgets:
@@ -391,13 +387,8 @@ def topography():
     
     if form.validate_on_submit():
         try:
-            # Parse coordinates
-            lines = (form.coordinates.data or "").strip().split('\n')
-            coordinates = []
-            for line in lines:
-                if line.strip():
-                    x, y = map(float, line.strip().split(','))
-                    coordinates.append([x, y])
+            # Coordinates arrive parsed as (x, y) pairs
+            coordinates = form.coordinates.data
             
             result = TopographyCalculations.calculate_area_shoelace(coordinates)
             
@@ -442,7 +433,11 @@ def profile():
 @login_required
 def projects():
     """Lista todos os projetos do usuário"""
-    projects = Project.query.filter_by(user_id=current_user.id).order_by(Project.created_at.desc()).all()
+    # The cards show counts of all three collections; load them in one
+    # query each instead of three per project
+    projects = Project.query.filter_by(user_id=current_user.id).order_by(Project.created_at.desc())\
+                            .options(selectinload(Project.budgets), selectinload(Project.schedules),
+                                     selectinload(Project.calculations)).all()
     return render_template('projects/index.html', projects=projects)
 
 @app.route('/projects/new', methods=['GET', 'POST'])
@@ -574,12 +569,8 @@ def new_budget_item(project_id, budget_id):
             category=form.category.data,
             notes=form.notes.data
         )
+        # O total do orçamento é atualizado pelo listener de BudgetItem
         db.session.add(item)
-        
-        # Atualiza totais do orçamento
-        items = BudgetItem.query.filter_by(budget_id=budget_id).all()
-        budget.total_cost = sum(i.total_cost for i in items) + total_cost
-        
         db.session.commit()
         flash('Item adicionado ao orçamento!', 'success')
         return redirect(url_for('budget_detail', project_id=project_id, budget_id=budget_id))
@@ -1084,9 +1075,9 @@ def traffic_esal():
     
     if form.validate_on_submit():
         try:
-            # Parse axle loads and repetitions
-            axle_loads = [float(x.strip()) for x in (form.axle_loads.data or '').strip().split('\n') if x.strip()]
-            repetitions = [int(x.strip()) for x in (form.repetitions.data or '').strip().split('\n') if x.strip()]
+            # Axle loads and repetitions arrive parsed, one value per line
+            axle_loads = form.axle_loads.data
+            repetitions = form.repetitions.data
             
             result = PavementCalculations.calculate_traffic_esal(axle_loads, repetitions)
             
@@ -1166,17 +1157,12 @@ def steel_consumption():
     
     if form.validate_on_submit():
         try:
-            # Parse steel bar data
-            bar_data = []
-            lines = (form.steel_bars.data or '').strip().split('\n')
-            for line in lines:
-                if line.strip():
-                    diameter, length, quantity = map(float, line.strip().split(','))
-                    bar_data.append({
-                        'diameter': diameter,
-                        'length': length,
-                        'quantity': int(quantity)
-                    })
+            # Steel bars arrive parsed as (diameter, length, quantity) rows
+            bar_data = [{
+                'diameter': diameter,
+                'length': length,
+                'quantity': int(quantity)
+            } for diameter, length, quantity in form.steel_bars.data]
             
             result = QuantityCalculations.calculate_steel_consumption(bar_data)
             
@@ -0,0 +1,133 @@
+import unittest
+
+from calculations import (AdvancedGeotechnicalCalculations, AdvancedHydrologyCalculations,
+                          AdvancedPavementCalculations, AdvancedStructuralCalculations,
+                          BuildingSystemsCalculations, HydraulicsCalculations,
+                          IndustrialConstructionCalculations, StructuralCalculations)
+
+
+class BatchMatchesScalarTest(unittest.TestCase):
+    """Each *_batch entry, rounded like the scalar result, must equal it"""
+
+    def test_beam_moment(self):
+        lengths, loads, types = [5, 7.5, 4], [10, 22.5, 40], ['uniform', 'point', 'uniform']
+        batch = StructuralCalculations.calculate_beam_moment_batch(lengths, loads, types)
+        for i, case in enumerate(zip(lengths, loads, types)):
+            scalar = StructuralCalculations.calculate_beam_moment(*case)
+            self.assertEqual(round(batch['moment_max'][i], 2), scalar['moment_max'])
+            self.assertEqual(round(batch['shear_max'][i], 2), scalar['shear_max'])
+        with self.assertRaises(ValueError):
+            StructuralCalculations.calculate_beam_moment_batch([5], [10], 'torque')
+
+    def test_pipe_flow(self):
+        cases = [(100, 250, 8, 0.05), (150, 1200, 20, 0.1), (50, 40, 1.5, 0.0015)]
+        batch = HydraulicsCalculations.calculate_pipe_flow_batch(*map(list, zip(*cases)))
+        for i, case in enumerate(cases):
+            scalar = HydraulicsCalculations.calculate_pipe_flow(*case)
+            self.assertEqual(round(batch['velocity'][i], 3), scalar['velocity'])
+            self.assertEqual(round(batch['friction_factor'][i], 4), scalar['friction_factor'])
+            self.assertEqual(round(batch['head_loss'][i], 3), scalar['head_loss'])
+
+    def test_load_combination(self):
+        cases = [(100, 50, 20, 0), (0, 0, 0, 0), (35.5, 12.25, 8, 4.5)]
+        alphas = (1.35, 1.5, 1.4, 1.2)
+        batch = AdvancedStructuralCalculations.calculate_load_combination_batch(*map(list, zip(*cases)), alphas)
+        for i, case in enumerate(cases):
+            scalar = AdvancedStructuralCalculations.calculate_load_combination(*case, *alphas)
+            self.assertEqual(round(batch['ultimate_load'][i], 2), scalar['ultimate_load'])
+            for key in ('dead_contribution_pct', 'live_contribution_pct', 'wind_contribution_pct', 'snow_contribution_pct'):
+                self.assertEqual(round(batch[key][i], 1), scalar[key])
+
+    def test_eccentric_footing_stress(self):
+        eccentricities = [0, 0.2, -0.3, 0.6]
+        batch = AdvancedGeotechnicalCalculations.calculate_eccentric_footing_stress_batch(800, 2.4, 3.0, eccentricities)
+        for i, e in enumerate(eccentricities):
+            scalar = AdvancedGeotechnicalCalculations.calculate_eccentric_footing_stress(800, 2.4, 3.0, e)
+            self.assertEqual(round(batch['stress_max_kpa'][i], 2), scalar['stress_max_kpa'])
+            self.assertEqual(round(batch['stress_min_kpa'][i], 2), scalar['stress_min_kpa'])
+            self.assertEqual(round(batch['contact_length_m'][i], 2), scalar['contact_length_m'])
+
+    def test_infinite_slope_stability(self):
+        depths = [1.0, 2.5, 4.0, 6.5]
+        pore_pressures = [0, 5, 12.5, 30]
+        batch = AdvancedGeotechnicalCalculations.calculate_infinite_slope_stability_batch(
+            10, 18.5, depths, 30, 28, pore_pressures)
+        for i, (z, u) in enumerate(zip(depths, pore_pressures)):
+            scalar = AdvancedGeotechnicalCalculations.calculate_infinite_slope_stability(10, 18.5, z, 30, 28, u)
+            self.assertEqual(round(batch['factor_of_safety'][i], 3), scalar['factor_of_safety'])
+            self.assertEqual(round(batch['shear_stress_kpa'][i], 2), scalar['shear_stress_kpa'])
+            self.assertEqual(round(batch['shear_strength_kpa'][i], 2), scalar['shear_strength_kpa'])
+
+    def test_scs_runoff(self):
+        precipitations = [5, 40, 95.5, 180]
+        batch = AdvancedHydrologyCalculations.calculate_scs_runoff_batch(precipitations, 75)
+        for i, p in enumerate(precipitations):
+            scalar = AdvancedHydrologyCalculations.calculate_scs_runoff(p, 75)
+            self.assertEqual(round(batch[i], 2), scalar['runoff_mm'])
+
+    def test_kirpich_time(self):
+        lengths, slopes = [0.5, 2.0, 7.3], [0.8, 3.5, 12]
+        batch = AdvancedHydrologyCalculations.calculate_kirpich_time_batch(lengths, slopes)
+        for i, case in enumerate(zip(lengths, slopes)):
+            scalar = AdvancedHydrologyCalculations.calculate_kirpich_time(*case)
+            self.assertEqual(round(batch[i], 1), scalar['tc_minutes'])
+        with self.assertRaises(ValueError):
+            AdvancedHydrologyCalculations.calculate_kirpich_time_batch([1.0, 2.0], [2.5, 0])
+
+    def test_water_hammer(self):
+        velocity_changes = [0.5, -1.8, 3.2]
+        batch = AdvancedHydrologyCalculations.calculate_water_hammer_batch(1000, 1200, velocity_changes)
+        for i, dv in enumerate(velocity_changes):
+            scalar = AdvancedHydrologyCalculations.calculate_water_hammer(1000, 1200, dv)
+            self.assertEqual(round(batch[i], 0), scalar['pressure_increase_pa'])
+
+    def test_prismoidal_volume(self):
+        cases = [(12, 15, 20, 20), (0, 4.5, 9.25, 20), (33.3, 30, 28.1, 12.5)]
+        batch = BuildingSystemsCalculations.calculate_prismoidal_volume_batch(*map(list, zip(*cases)))
+        for i, case in enumerate(cases):
+            scalar = BuildingSystemsCalculations.calculate_prismoidal_volume(*case)
+            self.assertEqual(round(batch['prismoidal_volume_m3'][i], 3), scalar['prismoidal_volume_m3'])
+            self.assertEqual(round(batch['trapezoidal_volume_m3'][i], 3), scalar['trapezoidal_volume_m3'])
+
+    def test_pump_similarity_laws(self):
+        speeds = [1450, 1750, 2900, 3500]
+        batch = AdvancedHydrologyCalculations.calculate_pump_similarity_laws_batch(1750, 12.5, 32, 7.5, speeds)
+        for i, n2 in enumerate(speeds):
+            scalar = AdvancedHydrologyCalculations.calculate_pump_similarity_laws(1750, 12.5, 32, 7.5, n2)
+            for key in ('flow_rate_2_lps', 'head_2_m', 'power_2_kw'):
+                self.assertEqual(round(batch[key][i], 2), scalar[key])
+
+    def test_stopping_distance(self):
+        speeds, grades = [40, 60, 80, 110], [0, 3, -4, -2.5]
+        batch = AdvancedPavementCalculations.calculate_stopping_distance_batch(speeds, 2.5, 0.35, grades)
+        for i, (v, grade) in enumerate(zip(speeds, grades)):
+            scalar = AdvancedPavementCalculations.calculate_stopping_distance(v, 2.5, 0.35, grade)
+            for key in ('total_stopping_distance_m', 'reaction_distance_m', 'braking_distance_m'):
+                self.assertEqual(round(batch[key][i], 1), scalar[key])
+
+    def test_lighting_design(self):
+        cases = [(300, 20, 3200), (500, 48.5, 2600), (150, 12, 1800)]
+        batch = BuildingSystemsCalculations.calculate_lighting_design_batch(*map(list, zip(*cases)), 0.55, 0.75)
+        for i, case in enumerate(cases):
+            scalar = BuildingSystemsCalculations.calculate_lighting_design(*case, 0.55, 0.75)
+            self.assertEqual(batch['luminaires_needed'][i], scalar['luminaires_needed'])
+            self.assertEqual(round(batch['luminaires_exact'][i], 2), scalar['luminaires_exact'])
+            self.assertEqual(round(batch['actual_illuminance_lux'][i], 1), scalar['actual_illuminance_lux'])
+
+    def test_precast_element(self):
+        cases = [(6, 10, 40, 25), (8.5, 22, 55, 30), (12, 35, 80, 40)]
+        batch = IndustrialConstructionCalculations.calculate_precast_element_batch(*map(list, zip(*cases)))
+        for i, case in enumerate(cases):
+            scalar = IndustrialConstructionCalculations.calculate_precast_element(*case)
+            self.assertEqual(round(batch['max_moment_knm'][i], 2), scalar['max_moment_knm'])
+            self.assertEqual(round(batch['max_deflection_mm'][i], 2), scalar['max_deflection_mm'])
+            self.assertEqual(round(batch['moment_inertia_cm4'][i], 2), scalar['moment_inertia_cm4'])
+
+    def test_precast_element_scalar_arguments(self):
+        batch = IndustrialConstructionCalculations.calculate_precast_element_batch(6, [10, 12], 40, 25)
+        self.assertEqual(len(batch['max_moment_knm']), 2)
+        self.assertEqual(batch['max_moment_knm'][0], 45.0)
+
+
+if __name__ == '__main__':
+    unittest.main()